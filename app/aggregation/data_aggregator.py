@@ -8,7 +8,6 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from decimal import Decimal
 import logging
-import asyncio
 
 from app.models.cv_submission import CVSubmission
 from app.models.extracted_data import ExtractedData
@@ -103,12 +102,12 @@ class DataAggregator:
         # Quality scores (GPT or legacy)
         if self.use_gpt_quality and self.gpt_scorer:
             # Use GPT for comprehensive profile quality assessment
-            gpt_quality = asyncio.run(self._calculate_gpt_profile_quality(
+            gpt_quality = await self._calculate_gpt_profile_quality(
                 github_data,
                 linkedin_data,
                 web_mentions,
                 extracted_data
-            ))
+            )
             overall_quality = gpt_quality.get("overall_quality_score", 50.0)
             data_freshness = gpt_quality.get("data_freshness", 50.0)
         else:
@@ -356,7 +356,10 @@ async def analyze_github_with_ai(
 
     # Analyze with OpenAI (now includes resume content)
     analyzer = OpenAIAnalyzer()
-    skills_analysis = await analyzer.extract_skills_from_github(github_dict, resume_content)
+    try:
+        skills_analysis = await analyzer.extract_skills_from_github(github_dict, resume_content)
+    finally:
+        await analyzer.aclose()
 
     return {
         "submission_id": str(submission_id),
@@ -1,6 +1,7 @@
 """
 CV Upload API endpoints
 """
+import asyncio
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
 from datetime import datetime
@@ -47,8 +48,8 @@ async def process_cv_extraction(
         submission.status = "processing"
         db.commit()
 
-        # Parse CV
-        raw_text, parse_method = CVParser.parse_cv(file_path, file_type)
+        # Parse CV off the event loop; PDF parsing is CPU-bound
+        raw_text, parse_method = await asyncio.to_thread(CVParser.parse_cv, file_path, file_type)
 
         if not raw_text:
             submission.status = "failed"
@@ -57,12 +58,13 @@ async def process_cv_extraction(
             return
 
         # Extract data
-        email, email_conf = DataExtractor.extract_email(raw_text)
-        phone, phone_conf = DataExtractor.extract_phone(raw_text)
-        social_links = DataExtractor.extract_social_links(raw_text)
-        work_history = DataExtractor.extract_work_history(raw_text)
-        education = DataExtractor.extract_education(raw_text)
-        skills = DataExtractor.extract_skills(raw_text)
+        extracted = DataExtractor.extract_all(raw_text)
+        email, email_conf = extracted['email']
+        phone, phone_conf = extracted['phone']
+        social_links = extracted['social_links']
+        work_history = extracted['work_history']
+        education = extracted['education']
+        skills = extracted['skills']
 
         # Prepare extracted data
         extracted_data_dict = {
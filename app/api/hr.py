@@ -13,7 +13,7 @@ from app.database import get_db
 from app.models import User
 from app.core import get_current_admin
 from app.services.candidate_aggregation_service import CandidateAggregationService
-from app.services.job_matching_service import JobMatchingService
+from app.services.job_matching_service import get_job_matching_service
 
 router = APIRouter(prefix="/hr", tags=["HR Dashboard"])
 
@@ -133,7 +133,7 @@ async def match_candidates(
             }
 
         # Match candidates to job
-        matching_service = JobMatchingService()
+        matching_service = get_job_matching_service()
         results = await matching_service.match_candidates_to_job(
             job_description=request.job_description,
             candidates=candidates,
@@ -2,6 +2,7 @@
 Processing API endpoints
 Handles skill processing, validation, and profile building
 """
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import Dict, Any
@@ -95,7 +96,7 @@ def get_processing_status(
 
 
 @router.post("/validate/{submission_id}")
-def validate_skills(
+async def validate_skills(
     submission_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -110,22 +111,24 @@ def validate_skills(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     validation_service = get_validation_service()
-    results = validation_service.validate_submission_skills(submission_id, db)
+    results = await validation_service.validate_submission_skills(submission_id, db)
 
     return results
 
 
 @router.post("/build-profile/{submission_id}")
-def build_skill_profile(
+async def build_skill_profile(
     submission_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -141,16 +144,18 @@ def build_skill_profile(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     profile_service = get_profile_service()
-    profile = profile_service.build_skill_profile(submission_id, db)
+    profile = await profile_service.build_skill_profile(submission_id, db)
 
     return profile
 
@@ -2,6 +2,7 @@
 Skills API endpoints
 Retrieve and query skill information
 """
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/api/v1/skills", tags=["skills"])
 
 
 @router.get("/{submission_id}")
-def get_skills(
+async def get_skills(
     submission_id: UUID,
     category: Optional[str] = None,
     min_confidence: Optional[int] = None,
@@ -36,17 +37,19 @@ def get_skills(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     # Get validated skills
     validation_service = get_validation_service()
-    results = validation_service.validate_submission_skills(submission_id, db)
+    results = await validation_service.validate_submission_skills(submission_id, db)
 
     skills = results["validated_skills"]
 
@@ -100,7 +103,7 @@ def get_skill_details(
 
 
 @router.get("/{submission_id}/by-category")
-def get_skills_by_category(
+async def get_skills_by_category(
     submission_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -110,17 +113,19 @@ def get_skills_by_category(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     from app.services.skill_profile_service import get_profile_service
     profile_service = get_profile_service()
-    profile = profile_service.build_skill_profile(submission_id, db)
+    profile = await profile_service.build_skill_profile(submission_id, db)
 
     return {
         "submission_id": str(submission_id),
@@ -129,7 +134,7 @@ def get_skills_by_category(
 
 
 @router.get("/{submission_id}/top")
-def get_top_skills(
+async def get_top_skills(
     submission_id: UUID,
     limit: int = Query(default=10, ge=1, le=50),
     db: Session = Depends(get_db),
@@ -140,16 +145,18 @@ def get_top_skills(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     validation_service = get_validation_service()
-    results = validation_service.validate_submission_skills(submission_id, db)
+    results = await validation_service.validate_submission_skills(submission_id, db)
 
     top_skills = results["validated_skills"][:limit]
 
@@ -161,7 +168,7 @@ def get_top_skills(
 
 
 @router.get("/{submission_id}/relationships")
-def get_skill_relationships(
+async def get_skill_relationships(
     submission_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -171,17 +178,19 @@ def get_skill_relationships(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     from app.services.skill_profile_service import get_profile_service
     profile_service = get_profile_service()
-    profile = profile_service.build_skill_profile(submission_id, db)
+    profile = await profile_service.build_skill_profile(submission_id, db)
 
     return {
         "submission_id": str(submission_id),
@@ -191,7 +200,7 @@ def get_skill_relationships(
 
 
 @router.get("/{submission_id}/gaps")
-def get_skill_gaps(
+async def get_skill_gaps(
     submission_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -201,17 +210,19 @@ def get_skill_gaps(
     """
     # Verify ownership
     from app.models.cv_submission import CVSubmission
-    submission = db.query(CVSubmission).filter(
-        CVSubmission.id == str(submission_id),
-        CVSubmission.user_id == current_user.id
-    ).first()
+    submission = await asyncio.to_thread(
+        db.query(CVSubmission).filter(
+            CVSubmission.id == str(submission_id),
+            CVSubmission.user_id == current_user.id
+        ).first
+    )
 
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
     from app.services.skill_profile_service import get_profile_service
     profile_service = get_profile_service()
-    profile = profile_service.build_skill_profile(submission_id, db)
+    profile = await profile_service.build_skill_profile(submission_id, db)
 
     return {
         "submission_id": str(submission_id),
@@ -56,6 +56,11 @@ class Settings(BaseSettings):
 
     # OpenAI Configuration
     OPENAI_API_KEY: str = ""
+    OPENAI_CONCURRENCY: int = 10  # Max concurrent OpenAI requests per scoring service
+    OPENAI_RPM: int = 500  # Account request limit per minute (GPT-4o tier 1 default)
+    OPENAI_TPM: int = 30000  # Account token limit per minute (GPT-4o tier 1 default)
+    GPT_CACHE_PATH: str = ""  # SQLite file persisting GPT results across restarts (empty = memory only)
+    GPT_CACHE_TTL_DAYS: int = 30
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -71,6 +71,18 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down SkillSense API...")
 
+    # Release pooled OpenAI, link-check and GitHub API connections
+    from app.services.gpt_scoring_service import close_gpt_scoring_service
+    await close_gpt_scoring_service()
+    from app.services.job_matching_service import close_job_matching_service
+    await close_job_matching_service()
+    from app.services.link_validator import close_link_validator
+    await close_link_validator()
+
+    # Stop the PDF page extraction worker processes
+    from app.services.cv_parser import close_cv_parser
+    close_cv_parser()
+
 
 # Create FastAPI application
 app = FastAPI(
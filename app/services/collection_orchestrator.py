@@ -562,7 +562,10 @@ class CollectionOrchestrator:
 
             # Analyze with OpenAI (now includes resume content)
             analyzer = OpenAIAnalyzer()
-            analysis_result = await analyzer.comprehensive_analysis(github_dict, resume_content)
+            try:
+                analysis_result = await analyzer.comprehensive_analysis(github_dict, resume_content)
+            finally:
+                await analyzer.aclose()
 
             skills_analysis = analysis_result.get('skills_analysis', {})
             activity_analysis = analysis_result.get('activity_analysis', {})
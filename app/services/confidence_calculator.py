@@ -5,6 +5,7 @@ Implements the confidence scoring algorithm for cross-source skill validation
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +34,34 @@ class ConfidenceCalculatorService:
         "all_sources": 95
     }
 
+    # Increment each BASE_SCORES tier adds over the one below it
+    GITHUB_STEP = BASE_SCORES["cv_github"] - BASE_SCORES["cv_only"]
+    WEB_STEP = BASE_SCORES["cv_github_web"] - BASE_SCORES["cv_github"]
+    STACKOVERFLOW_STEP = BASE_SCORES["all_sources"] - BASE_SCORES["cv_github_web"]
+
     # Bonus scores
     BONUS_ENDORSEMENTS = 5
     BONUS_ARTICLES = 5
     BONUS_RECENT_ACTIVITY_MIN = 5
     BONUS_RECENT_ACTIVITY_MAX = 10
 
+    # Partial credit when the CV does not list the skill, keyed by
+    # github | web << 1 | stackoverflow << 2. GitHub takes precedence,
+    # then web, then Stack Overflow.
+    NO_CV_SCORES = {
+        0b000: 0,
+        0b001: 50,  # GitHub
+        0b011: 50,
+        0b101: 50,
+        0b111: 50,
+        0b010: 40,  # Web
+        0b110: 40,
+        0b100: 45,  # Stack Overflow
+    }
+
+    # Bit position of each source in an encoded source mask (see _encode_sources)
+    SOURCE_ORDER = ("cv", "github", "web_mentions", "stackoverflow", "blog")
+
     def __init__(self):
         """Initialize confidence calculator"""
         pass
@@ -47,7 +70,9 @@ class ConfidenceCalculatorService:
         self,
         skill: str,
         sources: Dict[str, bool],
-        evidence: Optional[Dict[str, any]] = None
+        evidence: Optional[Dict[str, any]] = None,
+        include_sources_list: bool = True,
+        now: Optional[datetime] = None
     ) -> Dict[str, any]:
         """
         Calculate confidence score for a single skill.
@@ -71,6 +96,10 @@ class ConfidenceCalculatorService:
                     "github_commits": int,
                     "web_mentions_count": int
                 }
+            include_sources_list: Build the "sources_found" list. When False,
+                "sources_found" is None and only "source_count" is computed.
+            now: Reference time for the activity bonus. Batch callers should
+                capture this once and pass it for every skill.
 
         Returns:
             Dict with confidence score and breakdown
@@ -105,7 +134,7 @@ class ConfidenceCalculatorService:
                 total_bonus += self.BONUS_ARTICLES
 
             # Recent activity bonus
-            activity_bonus = self._calculate_activity_bonus(evidence)
+            activity_bonus = self._calculate_activity_bonus(evidence, now)
             if activity_bonus > 0:
                 bonuses["recent_activity"] = activity_bonus
                 total_bonus += activity_bonus
@@ -117,7 +146,12 @@ class ConfidenceCalculatorService:
         confidence_level = self._get_confidence_level(final_score)
 
         # List of sources found
-        sources_found = [source for source, found in sources.items() if found]
+        if include_sources_list:
+            sources_found = [source for source, found in sources.items() if found]
+            source_count = len(sources_found)
+        else:
+            sources_found = None
+            source_count = sum(1 for found in sources.values() if found)
 
         return {
             "skill": skill,
@@ -127,58 +161,52 @@ class ConfidenceCalculatorService:
             "bonuses": bonuses,
             "total_bonus": total_bonus,
             "sources_found": sources_found,
-            "source_count": len(sources_found)
+            "source_count": source_count
         }
 
     def _calculate_base_score(self, sources: Dict[str, bool]) -> int:
         """
         Calculate base confidence score based on source combinations.
 
-        Priority order (highest score wins):
-        1. All sources (CV + GitHub + Web + Stack Overflow): 95%
-        2. CV + GitHub + Web: 90%
-        3. CV + GitHub: 75%
-        4. CV only: 60%
+        With a CV the score is the highest BASE_SCORES tier reached:
+        all_sources (CV + GitHub + Web + Stack Overflow), cv_github_web,
+        cv_github, then cv_only. Without one it comes from NO_CV_SCORES.
         """
-        has_cv = sources.get("cv", False)
-        has_github = sources.get("github", False)
-        has_web = sources.get("web_mentions", False) or sources.get("blog", False)
-        has_stackoverflow = sources.get("stackoverflow", False)
-
-        # All sources present
-        if has_cv and has_github and has_web and has_stackoverflow:
-            return self.BASE_SCORES["all_sources"]
+        get = sources.get
+        has_cv = bool(get("cv", False))
+        has_github = bool(get("github", False))
+        has_web = bool(get("web_mentions", False) or get("blog", False))
+        has_stackoverflow = bool(get("stackoverflow", False))
 
-        # CV + GitHub + Web (but not Stack Overflow)
-        if has_cv and has_github and has_web:
-            return self.BASE_SCORES["cv_github_web"]
+        # With a CV each tier reached adds its step on top of cv_only
+        if has_cv:
+            return (
+                self.BASE_SCORES["cv_only"]
+                + self.GITHUB_STEP * has_github
+                + self.WEB_STEP * (has_github and has_web)
+                + self.STACKOVERFLOW_STEP * (has_github and has_web and has_stackoverflow)
+            )
 
-        # CV + GitHub (but not web)
-        if has_cv and has_github:
-            return self.BASE_SCORES["cv_github"]
+        # Without a CV, partial credit is looked up from the remaining sources
+        return self.NO_CV_SCORES[has_github | (has_web << 1) | (has_stackoverflow << 2)]
 
-        # CV only
-        if has_cv:
-            return self.BASE_SCORES["cv_only"]
-
-        # If no CV but other sources exist, give partial credit
-        # GitHub alone: 50%
-        # Web alone: 40%
-        # Stack Overflow alone: 45%
-        if has_github and not has_cv:
-            return 50
-        if has_web and not has_cv:
-            return 40
-        if has_stackoverflow and not has_cv:
-            return 45
-
-        # Multiple sources but no CV
-        if (has_github or has_web or has_stackoverflow):
-            return 55
+    def _encode_sources(self, sources: Dict[str, bool]) -> int:
+        """
+        Encode a source-presence dict as an integer bitmask.
 
-        return 0
+        Bit i is set when SOURCE_ORDER[i] is present, so CV is bit 0.
+        """
+        mask = 0
+        for i, source in enumerate(self.SOURCE_ORDER):
+            if sources.get(source):
+                mask |= 1 << i
+        return mask
 
-    def _calculate_activity_bonus(self, evidence: Dict[str, any]) -> int:
+    def _calculate_activity_bonus(
+        self,
+        evidence: Dict[str, any],
+        now: Optional[datetime] = None
+    ) -> int:
         """
         Calculate bonus for recent activity.
 
@@ -186,6 +214,9 @@ class ConfidenceCalculatorService:
         - Very recent (< 3 months): +10
         - Recent (3-6 months): +5
         - Old (> 6 months): +0
+
+        Days are counted as the difference of calendar-day ordinals. Pass
+        `now` to reuse one reference time across a batch of skills.
         """
         last_activity = evidence.get("last_activity_date")
 
@@ -198,8 +229,15 @@ class ConfidenceCalculatorService:
             except Exception:
                 return 0
 
-        now = datetime.now(last_activity.tzinfo) if last_activity.tzinfo else datetime.now()
-        days_since_activity = (now - last_activity).days
+        if now is None:
+            now = datetime.now(last_activity.tzinfo) if last_activity.tzinfo else datetime.now()
+        elif last_activity.tzinfo:
+            # Count days on the activity's own calendar
+            now = now.astimezone(last_activity.tzinfo)
+        elif now.tzinfo:
+            now = now.astimezone().replace(tzinfo=None)
+
+        days_since_activity = now.toordinal() - last_activity.toordinal()
 
         # Very recent: < 90 days (3 months)
         if days_since_activity < 90:
@@ -264,11 +302,11 @@ class ConfidenceCalculatorService:
         average_score = sum(scores) / total_skills if total_skills > 0 else 0
 
         # Count by confidence level
-        expert_count = len([s for s in skills_data if s["confidence_level"] == "expert"])
-        high_count = len([s for s in skills_data if s["confidence_level"] == "high"])
-        medium_count = len([s for s in skills_data if s["confidence_level"] == "medium"])
-        low_count = len([s for s in skills_data if s["confidence_level"] == "low"])
-        very_low_count = len([s for s in skills_data if s["confidence_level"] == "very_low"])
+        expert_count = sum(1 for s in skills_data if s["confidence_level"] == "expert")
+        high_count = sum(1 for s in skills_data if s["confidence_level"] == "high")
+        medium_count = sum(1 for s in skills_data if s["confidence_level"] == "medium")
+        low_count = sum(1 for s in skills_data if s["confidence_level"] == "low")
+        very_low_count = sum(1 for s in skills_data if s["confidence_level"] == "very_low")
 
         return {
             "overall_confidence": round(average_score, 2),
@@ -306,26 +344,29 @@ class ConfidenceCalculatorService:
             stackoverflow_skills: Skills from Stack Overflow
             blog_skills: Skills from personal blog
 
+        Skill names must be str; they are interned with sys.intern.
+
         Returns:
             Dict mapping skill names to source presence
         """
-        all_skills = set()
-        all_skills.update(cv_skills or [])
-        all_skills.update(github_skills or [])
-        all_skills.update(web_skills or [])
-        all_skills.update(stackoverflow_skills or [])
-        if blog_skills:
-            all_skills.update(blog_skills)
+        # Intern names so identical skills share one string object across sources
+        cv_set = {sys.intern(s) for s in (cv_skills or ())}
+        github_set = {sys.intern(s) for s in (github_skills or ())}
+        web_set = {sys.intern(s) for s in (web_skills or ())}
+        stackoverflow_set = {sys.intern(s) for s in (stackoverflow_skills or ())}
+        blog_set = {sys.intern(s) for s in (blog_skills or ())}
+
+        all_skills = cv_set | github_set | web_set | stackoverflow_set | blog_set
 
         skill_sources = {}
 
         for skill in all_skills:
             skill_sources[skill] = {
-                "cv": skill in (cv_skills or []),
-                "github": skill in (github_skills or []),
-                "web_mentions": skill in (web_skills or []),
-                "stackoverflow": skill in (stackoverflow_skills or []),
-                "blog": skill in (blog_skills or []) if blog_skills else False
+                "cv": skill in cv_set,
+                "github": skill in github_set,
+                "web_mentions": skill in web_set,
+                "stackoverflow": skill in stackoverflow_set,
+                "blog": skill in blog_set
             }
 
         return skill_sources
@@ -350,16 +391,20 @@ class ConfidenceCalculatorService:
             List of potentially conflicting skills
         """
         conflicts = []
+        order = self.SOURCE_ORDER
 
         for skill, sources in skill_sources.items():
-            source_count = sum(1 for present in sources.values() if present)
+            mask = self._encode_sources(sources)
+            source_count = mask.bit_count()
+            has_cv = mask & 1
 
             # Flag if only 1 source
             if source_count == 1:
-                only_source = [s for s, present in sources.items() if present][0]
+                # Index of the single set bit
+                only_source = order[(mask & -mask).bit_length() - 1]
 
                 # Extra suspicious if not in CV
-                if not sources.get("cv", False):
+                if not has_cv:
                     conflicts.append({
                         "skill": skill,
                         "reason": "single_source_no_cv",
@@ -375,8 +420,8 @@ class ConfidenceCalculatorService:
                     })
 
             # Flag if not in CV but in multiple other sources
-            elif not sources.get("cv", False) and source_count >= min_sources:
-                found_in = [s for s, present in sources.items() if present]
+            elif not has_cv and source_count >= min_sources:
+                found_in = [source for i, source in enumerate(order) if mask >> i & 1]
                 conflicts.append({
                     "skill": skill,
                     "reason": "missing_from_cv",
@@ -2,16 +2,85 @@
 CV Parser Service
 Extracts raw text from PDF, DOCX, and TXT files
 """
-import PyPDF2
-import pdfplumber
-from docx import Document
-from typing import Optional, Tuple
+import mmap
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+# Successful parses keyed by (file_path, mtime_ns, size, file_type) (LRU order).
+# Kept small: entries hold whole CV texts and a re-upload is the main hit
+_PARSE_CACHE_MAX_ENTRIES = 32
+_parse_cache: "OrderedDict[Tuple[str, int, int, str], Tuple[str, str]]" = OrderedDict()
+# parse_cv runs in worker threads (see process_cv_extraction)
+_parse_cache_lock = threading.Lock()
+
+
+def _extract_pages(args: Tuple[str, int, int]) -> List[str]:
+    """
+    Extract text from a contiguous range of PDF pages (runs inside a worker process)
+
+    Args:
+        args: (file_path, first_page, stop_page) tuple
+
+    Returns:
+        List[str]: Text of each page in the range, empty strings for pages with none
+    """
+    import pdfplumber
+
+    file_path, first_page, stop_page = args
+    with open(file_path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with pdfplumber.open(mapped) as pdf:
+                return [
+                    pdf.pages[i].extract_text() or ""
+                    for i in range(first_page, stop_page)
+                ]
+        finally:
+            mapped.close()
+
+
+# Worker processes for page extraction, shared by all parses (created on first use)
+_PDF_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+# Parses run in worker threads, so two of them may ask for the pool at once
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get or create the shared PDF page extraction pool"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Forking a threaded server process can copy held locks into the child;
+            # start workers from a clean interpreter instead
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=_PDF_POOL_MAX_WORKERS,
+                mp_context=multiprocessing.get_context(method)
+            )
+        return _pdf_pool
+
+
+def close_cv_parser() -> None:
+    """Shut down the shared PDF page extraction pool, if it was created"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown()
+            _pdf_pool = None
+
 
 class CVParser:
     """CV Parser for extracting text from various file formats"""
 
+    # Documents shorter than this are parsed sequentially; process startup would dominate
+    PARALLEL_MIN_PAGES = 3
+
     @staticmethod
     def parse_pdf_pypdf2(file_path: str) -> Optional[str]:
         """
@@ -23,14 +92,21 @@ class CVParser:
         Returns:
             Optional[str]: Extracted text or None if failed
         """
+        import PyPDF2
+
         try:
             text_content = []
             with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
+                # Memory-map the file so PyPDF2's seeks are served from the page cache
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    pdf_reader = PyPDF2.PdfReader(mapped)
+                    for page in pdf_reader.pages:
+                        text = page.extract_text()
+                        if text:
+                            text_content.append(text)
+                finally:
+                    mapped.close()
 
             return '\n\n'.join(text_content) if text_content else None
         except Exception as e:
@@ -48,19 +124,72 @@ class CVParser:
         Returns:
             Optional[str]: Extracted text or None if failed
         """
+        import pdfplumber
+
         try:
             text_content = []
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
+            with open(file_path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    with pdfplumber.open(mapped) as pdf:
+                        for page in pdf.pages:
+                            text = page.extract_text()
+                            if text:
+                                text_content.append(text)
+                finally:
+                    mapped.close()
 
             return '\n\n'.join(text_content) if text_content else None
         except Exception as e:
             print(f"pdfplumber parsing failed: {str(e)}")
             return None
 
+    @staticmethod
+    def parse_pdf_pdfplumber_parallel(file_path: str) -> Optional[str]:
+        """
+        Parse PDF using pdfplumber, extracting page ranges concurrently in the shared worker pool
+
+        Args:
+            file_path: Path to PDF file
+
+        Returns:
+            Optional[str]: Extracted text or None if failed
+        """
+        import pdfplumber
+
+        try:
+            texts = None
+            with open(file_path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    with pdfplumber.open(mapped) as pdf:
+                        page_count = len(pdf.pages)
+                        # Short documents are extracted here, from the already open PDF
+                        if page_count < CVParser.PARALLEL_MIN_PAGES:
+                            texts = [page.extract_text() for page in pdf.pages]
+                finally:
+                    mapped.close()
+
+            if texts is None:
+                # One contiguous range per worker, so each process opens the PDF once
+                workers = min(_PDF_POOL_MAX_WORKERS, page_count)
+                step = -(-page_count // workers)
+                ranges = [
+                    (file_path, first, min(first + step, page_count))
+                    for first in range(0, page_count, step)
+                ]
+                texts = [
+                    text
+                    for page_texts in _get_pdf_pool().map(_extract_pages, ranges)
+                    for text in page_texts
+                ]
+
+            text_content = [text for text in texts if text]
+            return '\n\n'.join(text_content) if text_content else None
+        except Exception as e:
+            print(f"pdfplumber parallel parsing failed: {str(e)}")
+            return None
+
     @staticmethod
     def parse_pdf(file_path: str) -> Tuple[Optional[str], str]:
         """
@@ -73,7 +202,7 @@ class CVParser:
             Tuple[Optional[str], str]: (Extracted text, method used)
         """
         # Try pdfplumber first (usually better for complex layouts)
-        text_plumber = CVParser.parse_pdf_pdfplumber(file_path)
+        text_plumber = CVParser.parse_pdf_pdfplumber_parallel(file_path)
 
         # Try PyPDF2 as fallback
         text_pypdf2 = CVParser.parse_pdf_pypdf2(file_path)
@@ -91,6 +220,27 @@ class CVParser:
         else:
             return None, "failed"
 
+    @staticmethod
+    def _flatten_tables(tables) -> List[str]:
+        """
+        Flatten DOCX tables into one ' | '-joined line per non-empty row
+
+        Args:
+            tables: python-docx table objects
+
+        Returns:
+            List[str]: Row lines in document order
+        """
+        lines = []
+        append = lines.append
+        join = ' | '.join
+        for table in tables:
+            for row in table.rows:
+                row_text = join([cell.text.strip() for cell in row.cells])
+                if row_text.strip():
+                    append(row_text)
+        return lines
+
     @staticmethod
     def parse_docx(file_path: str) -> Optional[str]:
         """
@@ -102,6 +252,8 @@ class CVParser:
         Returns:
             Optional[str]: Extracted text or None if failed
         """
+        from docx import Document
+
         try:
             doc = Document(file_path)
             text_content = []
@@ -112,11 +264,7 @@ class CVParser:
                     text_content.append(paragraph.text)
 
             # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = ' | '.join(cell.text.strip() for cell in row.cells)
-                    if row_text.strip():
-                        text_content.append(row_text)
+            text_content.extend(CVParser._flatten_tables(doc.tables))
 
             return '\n'.join(text_content) if text_content else None
         except Exception as e:
@@ -135,20 +283,18 @@ class CVParser:
             Optional[str]: Extracted text or None if failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Try with different encoding if UTF-8 fails
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    return file.read()
-            except Exception as e:
-                print(f"TXT parsing failed: {str(e)}")
-                return None
+            with open(file_path, 'rb') as file:
+                raw = file.read()
         except Exception as e:
             print(f"TXT parsing failed: {str(e)}")
             return None
 
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            # Fall back to latin-1 in memory instead of re-opening the file
+            return raw.decode('latin-1', errors='replace')
+
     @staticmethod
     def parse_cv(file_path: str, file_type: str) -> Tuple[Optional[str], str]:
         """
@@ -161,9 +307,41 @@ class CVParser:
         Returns:
             Tuple[Optional[str], str]: (Extracted text, method/status)
         """
-        if not Path(file_path).exists():
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
             return None, "file_not_found"
 
+        # mtime and size are part of the cache key, so edits invalidate old entries
+        key = (file_path, stat.st_mtime_ns, stat.st_size, file_type)
+        with _parse_cache_lock:
+            cached = _parse_cache.get(key)
+            if cached is not None:
+                _parse_cache.move_to_end(key)
+                return cached
+
+        result = CVParser._parse_cv_uncached(file_path, file_type)
+
+        # Failures are not cached, so a transient error can be retried
+        if result[0]:
+            with _parse_cache_lock:
+                _parse_cache[key] = result
+                if len(_parse_cache) > _PARSE_CACHE_MAX_ENTRIES:
+                    _parse_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _parse_cv_uncached(file_path: str, file_type: str) -> Tuple[Optional[str], str]:
+        """
+        Parse CV file based on file type, without consulting the cache
+
+        Args:
+            file_path: Path to CV file
+            file_type: Type of file (pdf, docx, txt)
+
+        Returns:
+            Tuple[Optional[str], str]: (Extracted text, method/status)
+        """
         if file_type == "pdf":
             return CVParser.parse_pdf(file_path)
         elif file_type == "docx":
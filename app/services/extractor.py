@@ -7,12 +7,20 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 
 
+def _substring_closure(words: List[str]) -> Dict[str, frozenset]:
+    """Map each word to the set of words it contains as a substring (itself included)"""
+    return {word: frozenset(other for other in words if other in word) for word in words}
+
+
 class DataExtractor:
     """Extract structured data from CV text"""
 
     # Email regex pattern
     EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
 
+    # Well-known mail providers (domain head, e.g. 'gmail' in 'gmail.com')
+    PROFESSIONAL_EMAIL_DOMAINS = frozenset({'gmail', 'outlook', 'yahoo', 'hotmail', 'icloud'})
+
     # Phone regex patterns (various formats)
     PHONE_PATTERNS = [
         r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
@@ -23,8 +31,51 @@ class DataExtractor:
     # Social media URL patterns
     GITHUB_PATTERN = r'(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9_-]+)'
     LINKEDIN_PATTERN = r'(?:https?://)?(?:www\.)?linkedin\.com/in/([A-Za-z0-9_-]+)'
-    TWITTER_PATTERN = r'(?:https?://)?(?:www\.)?(?:twitter|x)\.com/([A-Za-z0-9_]+)'
-    PORTFOLIO_PATTERN = r'(?:https?://)?(?:www\.)?([A-Za-z0-9-]+\.[A-Za-z]{2,})(?:/[^\s]*)?'
+    # Not preceded by a label character, so e.g. dropbox.com/foo is no x.com link
+    TWITTER_PATTERN = r'(?<![A-Za-z0-9-])(?:https?://)?(?:www\.)?(?:twitter|x)\.com/([A-Za-z0-9_]+)'
+    # Possessive quantifiers (Python 3.11+) keep matching linear: once a prefix,
+    # label or tail is consumed the engine never retries shorter splits of it.
+    # 'www.' is only taken as a prefix when another label follows it.
+    PORTFOLIO_PATTERN = r'\b(?:https?://)?+(?:www\.(?=[A-Za-z0-9-]+\.))?+([A-Za-z0-9-]++\.[A-Za-z]{2,}+)(?:/\S*+)?'
+
+    # Month abbreviations, factored by shared prefix to cut alternation attempts
+    MONTH_PATTERN = r'(?:Jan|Feb|Ma[ry]|Apr|Ju[nl]|Aug|Sep|Oct|Nov|Dec)[a-z]*'
+
+    # Work history date pattern (e.g. "Jan 2020", "2018 - Present").
+    # Only used as a presence test, so all groups are non-capturing.
+    DATE_PATTERN = rf'(?:{MONTH_PATTERN} \d{{4}}|(?:19|20)\d{{2}}(?:\s*-\s*(?:Present|Current|{MONTH_PATTERN} \d{{4}}|(?:19|20)\d{{2}}))?)'
+
+    # Common degree patterns
+    DEGREE_PATTERNS = [
+        r'(?:Bachelor|B\.?S\.?|B\.?A\.?|Master|M\.?S\.?|M\.?A\.?|PhD|Ph\.?D\.?|MBA|MD)',
+        r'(?:Associate|Diploma|Certificate)'
+    ]
+
+    # Precompiled patterns (avoids re's per-call cache lookup).
+    # Email and phone patterns run on str: PDF text often separates phone
+    # groups with non-breaking spaces, which only Unicode \s matches.
+    EMAIL_RE = re.compile(EMAIL_PATTERN, re.IGNORECASE)
+    PHONE_RES = [re.compile(pattern) for pattern in PHONE_PATTERNS]
+    PHONE_CLEAN_RE = re.compile(r'[^\d+()-]')
+    GITHUB_RE = re.compile(GITHUB_PATTERN, re.IGNORECASE)
+    LINKEDIN_RE = re.compile(LINKEDIN_PATTERN, re.IGNORECASE)
+    TWITTER_RE = re.compile(TWITTER_PATTERN, re.IGNORECASE)
+    PORTFOLIO_RE = re.compile(PORTFOLIO_PATTERN, re.IGNORECASE)
+
+    # Known social sites that never count as a portfolio domain
+    PORTFOLIO_EXCLUDE_RE = re.compile(r'github|linkedin|twitter|x\.com|facebook', re.IGNORECASE)
+
+    # Social link kinds: compiled pattern, profile URL prefix, confidence, and
+    # lowercase substrings that must be present for the pattern to be worth running
+    SOCIAL_KINDS = (
+        ('github', GITHUB_RE, 'https://github.com/', 90.0, ('github.com',)),
+        ('linkedin', LINKEDIN_RE, 'https://linkedin.com/in/', 90.0, ('linkedin.com/in/',)),
+        ('twitter', TWITTER_RE, 'https://twitter.com/', 85.0, ('twitter.com', 'x.com')),
+    )
+    DATE_RE = re.compile(DATE_PATTERN, re.IGNORECASE)
+    DEGREE_ALT_RE = re.compile('|'.join(DEGREE_PATTERNS), re.IGNORECASE)
+    YEAR_RE = re.compile(r'(19|20)\d{2}')
+    NEXT_SECTION_RE = re.compile(r'\n\s*[A-Z][A-Z\s]{3,}\s*[\n:]')
 
     # Section headers
     WORK_SECTIONS = ['experience', 'work history', 'employment', 'work experience', 'professional experience']
@@ -32,6 +83,28 @@ class DataExtractor:
     SKILLS_SECTIONS = ['skills', 'technical skills', 'core competencies', 'technologies']
     CERT_SECTIONS = ['certifications', 'certificates', 'licenses']
 
+    # Common skill keywords (this would be a much larger list in production)
+    TECH_SKILLS = [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
+        'react', 'angular', 'vue', 'node', 'django', 'flask', 'spring', 'express',
+        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
+        'machine learning', 'ai', 'deep learning', 'nlp', 'computer vision',
+        'html', 'css', 'rest', 'api', 'microservices', 'agile', 'scrum'
+    ]
+
+    # Zero-width lookahead so overlapping skills are still seen; longest
+    # alternatives first so each position reports its longest skill
+    TECH_SKILLS_RE = re.compile(
+        '(?=(' + '|'.join(re.escape(skill) for skill in sorted(TECH_SKILLS, key=len, reverse=True)) + '))'
+    )
+
+    # Every skill mapped to the skills it contains as a substring (itself included)
+    TECH_SKILL_CONTAINS = _substring_closure(TECH_SKILLS)
+
+    # Compiled section header patterns, keyed by tuple(section_keywords)
+    _SECTION_RES: Dict[Tuple[str, ...], List[re.Pattern]] = {}
+
     @staticmethod
     def extract_email(text: str) -> Tuple[Optional[str], float]:
         """
@@ -43,25 +116,28 @@ class DataExtractor:
         Returns:
             Tuple[Optional[str], float]: (Email, confidence score)
         """
-        matches = re.findall(DataExtractor.EMAIL_PATTERN, text, re.IGNORECASE)
+        # Only the first match and whether a second exists are needed
+        matches = DataExtractor.EMAIL_RE.finditer(text)
+        first = next(matches, None)
 
-        if not matches:
+        if first is None:
             return None, 0.0
 
+        has_more = next(matches, None) is not None
+
         # Take the first email found (usually the primary one)
-        email = matches[0].lower()
+        email = first.group(0).lower()
 
         # Calculate confidence based on email quality
         confidence = 85.0  # Base confidence for valid email
 
         # Boost confidence for professional domains
-        professional_domains = ['gmail', 'outlook', 'yahoo', 'hotmail', 'icloud']
         domain = email.split('@')[1]
-        if any(prof in domain for prof in professional_domains):
+        if domain.split('.', 1)[0] in DataExtractor.PROFESSIONAL_EMAIL_DOMAINS:
             confidence += 10.0
 
         # Reduce confidence if multiple emails found
-        if len(matches) > 1:
+        if has_more:
             confidence -= 5.0
 
         return email, min(confidence, 99.0)
@@ -77,12 +153,11 @@ class DataExtractor:
         Returns:
             Tuple[Optional[str], float]: (Phone number, confidence score)
         """
-        for pattern in DataExtractor.PHONE_PATTERNS:
-            matches = re.findall(pattern, text)
-            if matches:
-                phone = matches[0]
+        for pattern in DataExtractor.PHONE_RES:
+            match = pattern.search(text)
+            if match:
                 # Clean up the phone number
-                phone = re.sub(r'[^\d+()-]', '', phone)
+                phone = DataExtractor.PHONE_CLEAN_RE.sub('', match.group(0))
 
                 # Calculate confidence based on format
                 confidence = 75.0  # Base confidence
@@ -108,47 +183,57 @@ class DataExtractor:
         Returns:
             Dict: Social media links with confidence scores
         """
-        results = {}
-
-        # Extract GitHub
-        github_matches = re.findall(DataExtractor.GITHUB_PATTERN, text, re.IGNORECASE)
-        if github_matches:
-            username = github_matches[0]
-            results['github'] = (f"https://github.com/{username}", 90.0)
-        else:
-            results['github'] = (None, 0.0)
-
-        # Extract LinkedIn
-        linkedin_matches = re.findall(DataExtractor.LINKEDIN_PATTERN, text, re.IGNORECASE)
-        if linkedin_matches:
-            username = linkedin_matches[0]
-            results['linkedin'] = (f"https://linkedin.com/in/{username}", 90.0)
-        else:
-            results['linkedin'] = (None, 0.0)
-
-        # Extract Twitter/X
-        twitter_matches = re.findall(DataExtractor.TWITTER_PATTERN, text, re.IGNORECASE)
-        if twitter_matches:
-            username = twitter_matches[0]
-            results['twitter'] = (f"https://twitter.com/{username}", 85.0)
-        else:
-            results['twitter'] = (None, 0.0)
-
-        # Extract portfolio/personal website
-        # Look for URLs that are not GitHub, LinkedIn, or Twitter
-        all_urls = re.findall(DataExtractor.PORTFOLIO_PATTERN, text, re.IGNORECASE)
-        portfolio_url = None
-        for url in all_urls:
-            if isinstance(url, tuple):
-                url = url[0]
-            if not any(site in url.lower() for site in ['github', 'linkedin', 'twitter', 'x.com', 'facebook']):
+        results = {
+            'github': (None, 0.0),
+            'linkedin': (None, 0.0),
+            'twitter': (None, 0.0),
+            'portfolio': (None, 0.0)
+        }
+
+        # Every link pattern needs a dot; skip the scan entirely without one
+        if '.' not in text:
+            return results
+
+        # Each kind is scanned on its own, so one link's match never hides
+        # another's; cheap substring checks skip patterns that cannot match
+        text_lower = text.lower()
+        for kind, pattern, url_prefix, confidence, needles in DataExtractor.SOCIAL_KINDS:
+            if any(needle in text_lower for needle in needles):
+                match = pattern.search(text)
+                if match:
+                    results[kind] = (f"{url_prefix}{match.group(1)}", confidence)
+
+        # Portfolio/personal website: first URL that is not a known social site
+        for match in DataExtractor.PORTFOLIO_RE.finditer(text):
+            url = match.group(1)
+            if not DataExtractor.PORTFOLIO_EXCLUDE_RE.search(url):
                 portfolio_url = url if url.startswith('http') else f"https://{url}"
+                results['portfolio'] = (portfolio_url, 70.0)
                 break
 
-        results['portfolio'] = (portfolio_url, 70.0 if portfolio_url else 0.0)
-
         return results
 
+    @staticmethod
+    def _section_patterns(section_keywords: List[str]) -> List[re.Pattern]:
+        """
+        Get compiled header patterns for a list of section keywords
+
+        Args:
+            section_keywords: List of possible section header names
+
+        Returns:
+            List[re.Pattern]: One case-insensitive pattern per keyword, in order
+        """
+        key = tuple(section_keywords)
+        patterns = DataExtractor._SECTION_RES.get(key)
+        if patterns is None:
+            patterns = [
+                re.compile(rf'\n\s*{re.escape(keyword)}\s*[\n:]', re.IGNORECASE)
+                for keyword in section_keywords
+            ]
+            DataExtractor._SECTION_RES[key] = patterns
+        return patterns
+
     @staticmethod
     def find_section(text: str, section_keywords: List[str]) -> Optional[str]:
         """
@@ -161,24 +246,20 @@ class DataExtractor:
         Returns:
             Optional[str]: Extracted section text
         """
-        text_lower = text.lower()
-
-        # Find the section start
-        section_start = -1
-        for keyword in section_keywords:
-            pattern = rf'\n\s*{re.escape(keyword)}\s*[\n:]'
-            match = re.search(pattern, text_lower)
+        # Find the section start (first keyword in list order that has a header).
+        # Searching the original text keeps offsets valid for non-ASCII case folds.
+        for pattern in DataExtractor._section_patterns(section_keywords):
+            match = pattern.search(text)
             if match:
-                section_start = match.start()
                 break
-
-        if section_start == -1:
+        else:
             return None
 
+        section_start = match.start()
+
         # Find the next section (next header in ALL CAPS or next known section)
-        next_section_pattern = r'\n\s*[A-Z][A-Z\s]{3,}\s*[\n:]'
         remaining_text = text[section_start + 1:]
-        next_match = re.search(next_section_pattern, remaining_text)
+        next_match = DataExtractor.NEXT_SECTION_RE.search(remaining_text)
 
         if next_match:
             section_end = section_start + 1 + next_match.start()
@@ -188,36 +269,34 @@ class DataExtractor:
             return text[section_start:]
 
     @staticmethod
-    def extract_work_history(text: str) -> List[Dict[str, Any]]:
+    def extract_work_history(text: str, section: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Extract work history from text
 
         Args:
             text: CV text content
+            section: Pre-located section text ('' if known to be missing)
 
         Returns:
             List[Dict]: List of work experiences
         """
-        section = DataExtractor.find_section(text, DataExtractor.WORK_SECTIONS)
+        if section is None:
+            section = DataExtractor.find_section(text, DataExtractor.WORK_SECTIONS)
         if not section:
             return []
 
         experiences = []
 
         # Split by likely company entries (lines with dates)
-        date_pattern = r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}|(?:19|20)\d{2}(?:\s*-\s*(?:Present|Current|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}|(?:19|20)\d{2}))?)'
-
         # Simple extraction - this would be improved with NLP
-        lines = section.split('\n')
+        lines = [line for line in map(str.strip, section.splitlines()) if line]
         current_exp = {}
+        needs_company = needs_title = False
+        date_search = DataExtractor.DATE_RE.search
 
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
             # Check if line contains dates (likely start of experience)
-            if re.search(date_pattern, line, re.IGNORECASE):
+            if date_search(line):
                 if current_exp:
                     experiences.append(current_exp)
                 current_exp = {
@@ -226,12 +305,15 @@ class DataExtractor:
                     'dates': line,
                     'confidence': 70.0
                 }
-            elif current_exp:
-                # Try to identify if it's a company or title
-                if 'company' not in current_exp or current_exp['company'] == 'Unknown':
-                    current_exp['company'] = line
-                elif 'title' not in current_exp or current_exp['title'] == 'Unknown':
-                    current_exp['title'] = line
+                needs_company = needs_title = True
+            elif needs_company:
+                # First line after the dates is taken as the company...
+                current_exp['company'] = line
+                needs_company = False
+            elif needs_title:
+                # ...and the next one as the title
+                current_exp['title'] = line
+                needs_title = False
 
         if current_exp:
             experiences.append(current_exp)
@@ -239,58 +321,54 @@ class DataExtractor:
         return experiences[:5]  # Limit to 5 most recent
 
     @staticmethod
-    def extract_education(text: str) -> List[Dict[str, Any]]:
+    def extract_education(text: str, section: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Extract education from text
 
         Args:
             text: CV text content
+            section: Pre-located section text ('' if known to be missing)
 
         Returns:
             List[Dict]: List of education entries
         """
-        section = DataExtractor.find_section(text, DataExtractor.EDUCATION_SECTIONS)
+        if section is None:
+            section = DataExtractor.find_section(text, DataExtractor.EDUCATION_SECTIONS)
         if not section:
             return []
 
         education = []
 
-        # Common degree patterns
-        degree_patterns = [
-            r'(Bachelor|B\.?S\.?|B\.?A\.?|Master|M\.?S\.?|M\.?A\.?|PhD|Ph\.?D\.?|MBA|MD)',
-            r'(Associate|Diploma|Certificate)'
-        ]
-
-        lines = section.split('\n')
+        lines = [line for line in map(str.strip, section.splitlines()) if line]
         current_edu = {}
+        degree_search = DataExtractor.DEGREE_ALT_RE.search
+        year_search = DataExtractor.YEAR_RE.search
 
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+            # Classify the line once; the degree result drives both branches below
+            is_degree = degree_search(line) is not None
+
+            if is_degree:
+                if current_edu:
+                    education.append(current_edu)
+                current_edu = {
+                    'degree': line,
+                    'institution': '',
+                    'year': '',
+                    'confidence': 75.0
+                }
 
-            # Check for degree
-            for pattern in degree_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if current_edu:
-                        education.append(current_edu)
-                    current_edu = {
-                        'degree': line,
-                        'institution': '',
-                        'year': '',
-                        'confidence': 75.0
-                    }
-                    break
+            if not current_edu:
+                continue
 
             # Check for year
-            year_match = re.search(r'(19|20)\d{2}', line)
-            if year_match and current_edu:
+            year_match = year_search(line)
+            if year_match:
                 current_edu['year'] = year_match.group(0)
 
             # If not a degree line, might be institution
-            if current_edu and not re.search('|'.join(degree_patterns), line, re.IGNORECASE):
-                if not current_edu['institution']:
-                    current_edu['institution'] = line
+            if not is_degree and not current_edu['institution']:
+                current_edu['institution'] = line
 
         if current_edu:
             education.append(current_edu)
@@ -298,36 +376,34 @@ class DataExtractor:
         return education[:3]  # Limit to 3 entries
 
     @staticmethod
-    def extract_skills(text: str) -> List[Dict[str, Any]]:
+    def extract_skills(text: str, section: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Extract skills from text
 
         Args:
             text: CV text content
+            section: Pre-located section text ('' if known to be missing)
 
         Returns:
             List[Dict]: List of skills with confidence
         """
-        section = DataExtractor.find_section(text, DataExtractor.SKILLS_SECTIONS)
+        if section is None:
+            section = DataExtractor.find_section(text, DataExtractor.SKILLS_SECTIONS)
         if not section:
             return []
 
         skills = []
 
-        # Common skill keywords (this would be a much larger list in production)
-        tech_skills = [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
-            'react', 'angular', 'vue', 'node', 'django', 'flask', 'spring', 'express',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
-            'machine learning', 'ai', 'deep learning', 'nlp', 'computer vision',
-            'html', 'css', 'rest', 'api', 'microservices', 'agile', 'scrum'
-        ]
-
         section_lower = section.lower()
 
-        for skill in tech_skills:
-            if skill in section_lower:
+        # One pass finds the longest skill starting at each position; the
+        # closure adds every skill contained in it (e.g. 'java' in 'javascript')
+        found = set()
+        for match in DataExtractor.TECH_SKILLS_RE.finditer(section_lower):
+            found.update(DataExtractor.TECH_SKILL_CONTAINS[match.group(1)])
+
+        for skill in DataExtractor.TECH_SKILLS:
+            if skill in found:
                 skills.append({
                     'name': skill.title(),
                     'confidence': 85.0
@@ -335,12 +411,15 @@ class DataExtractor:
 
         # Also split by commas and extract
         lines = section.split('\n')
+        seen = {s['name'].lower() for s in skills}
         for line in lines:
             if ',' in line:
                 parts = line.split(',')
                 for part in parts:
                     part = part.strip()
-                    if part and len(part) > 2 and part.lower() not in [s['name'].lower() for s in skills]:
+                    part_lower = part.lower()
+                    if len(part) > 2 and part_lower not in seen:
+                        seen.add(part_lower)
                         skills.append({
                             'name': part,
                             'confidence': 75.0
@@ -348,6 +427,37 @@ class DataExtractor:
 
         return skills[:20]  # Limit to 20 skills
 
+    @staticmethod
+    def extract_all(text: str) -> Dict[str, Any]:
+        """
+        Run every extractor over the text, locating each CV section once
+
+        Args:
+            text: CV text content
+
+        Returns:
+            Dict: 'email', 'phone' and 'social_links' results as returned by
+            their extractors, plus 'work_history', 'education' and 'skills' lists
+        """
+        # '' marks a section that was searched for and not found
+        sections = {
+            kind: DataExtractor.find_section(text, keywords) or ''
+            for kind, keywords in (
+                ('work_history', DataExtractor.WORK_SECTIONS),
+                ('education', DataExtractor.EDUCATION_SECTIONS),
+                ('skills', DataExtractor.SKILLS_SECTIONS),
+            )
+        }
+
+        return {
+            'email': DataExtractor.extract_email(text),
+            'phone': DataExtractor.extract_phone(text),
+            'social_links': DataExtractor.extract_social_links(text),
+            'work_history': DataExtractor.extract_work_history(text, sections['work_history']),
+            'education': DataExtractor.extract_education(text, sections['education']),
+            'skills': DataExtractor.extract_skills(text, sections['skills'])
+        }
+
     @staticmethod
     def calculate_overall_confidence(extracted_data: Dict[str, Any]) -> float:
         """
@@ -359,30 +469,27 @@ class DataExtractor:
         Returns:
             float: Overall confidence score (0-100)
         """
-        confidences = []
+        total = 0.0
+        count = 0
 
         # Collect all confidence scores
-        if extracted_data.get('email_confidence'):
-            confidences.append(extracted_data['email_confidence'])
-
-        if extracted_data.get('phone_confidence'):
-            confidences.append(extracted_data['phone_confidence'])
-
-        if extracted_data.get('github_url_confidence'):
-            confidences.append(extracted_data['github_url_confidence'])
-
-        if extracted_data.get('linkedin_url_confidence'):
-            confidences.append(extracted_data['linkedin_url_confidence'])
+        for key in ('email_confidence', 'phone_confidence', 'github_url_confidence', 'linkedin_url_confidence'):
+            value = extracted_data.get(key)
+            if value:
+                total += value
+                count += 1
 
         # Add work history and education confidence
-        if extracted_data.get('work_history'):
-            confidences.extend([w.get('confidence', 0) for w in extracted_data['work_history']])
+        for entry in extracted_data.get('work_history') or ():
+            total += entry.get('confidence', 0)
+            count += 1
 
-        if extracted_data.get('education'):
-            confidences.extend([e.get('confidence', 0) for e in extracted_data['education']])
+        for entry in extracted_data.get('education') or ():
+            total += entry.get('confidence', 0)
+            count += 1
 
-        if not confidences:
+        if not count:
             return 0.0
 
         # Calculate weighted average
-        return round(sum(confidences) / len(confidences), 2)
+        return round(total / count, 2)
@@ -15,73 +15,37 @@ Provides:
 - Overall profile quality scores
 """
 
+import asyncio
 import json
-from typing import Dict, List, Any, Optional
-from openai import OpenAI
+import time
+from collections import Counter
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
+import httpx
+import orjson
+from openai import AsyncOpenAI
 import logging
 from datetime import datetime
+from itertools import islice
 
 from app.config import settings
+from app.services.openai_common import OpenAIServiceBase, squash_text
 
 logger = logging.getLogger(__name__)
 
+# Reused to decode skill objects out of a partially streamed response
+_JSON_DECODER = json.JSONDecoder()
 
-class GPTScoringService:
-    """AI-driven skill confidence scoring using GPT-4o"""
 
-    def __init__(self):
-        """Initialize OpenAI client"""
-        if not settings.OPENAI_API_KEY:
-            logger.warning("OpenAI API key not configured")
-            self.client = None
-        else:
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            logger.info("GPT Scoring Service initialized")
+# System prompts. Kept byte-identical across calls; the prebuilt message dicts
+# are shared by every request and must not be mutated.
+#
+# OpenAI caches identical prompt prefixes, so every request is ordered from most
+# to least shared: system prompt, then candidate context, then the skill name(s)
+# last. Keep per-request values at the end of the user message.
 
-    async def score_skill_confidence(
-        self,
-        skill_name: str,
-        github_data: Optional[Dict[str, Any]] = None,
-        linkedin_data: Optional[Dict[str, Any]] = None,
-        web_mentions: Optional[List[Dict[str, Any]]] = None,
-        cv_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """
-        Score a single skill using GPT-4o analysis of all available data.
-
-        Args:
-            skill_name: Name of the skill to score
-            github_data: GitHub profile and repository data (with README/commit samples)
-            linkedin_data: LinkedIn profile data
-            web_mentions: List of web mentions/articles
-            cv_data: CV/resume data
-
-        Returns:
-            Dict containing:
-                - confidence_score: 0-100 (how confident we are this is a real skill)
-                - proficiency_level: beginner|intermediate|advanced|expert
-                - years_experience: Estimated years (1-20+)
-                - evidence_quality: low|medium|high|excellent
-                - reasoning: Explanation of the score
-                - data_sources_used: List of sources that contributed
-        """
-        if not self.client:
-            logger.error("OpenAI client not initialized")
-            return self._fallback_skill_score(skill_name)
-
-        try:
-            # Prepare context for GPT
-            context = self._prepare_skill_context(
-                skill_name, github_data, linkedin_data, web_mentions, cv_data
-            )
-
-            # Call GPT-4o for skill-specific analysis
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an expert technical recruiter evaluating candidate skills.
+# Single-skill scoring
+_SKILL_SYSTEM_PROMPT = """You are an expert technical recruiter evaluating candidate skills.
 
 Analyze ALL available evidence about this specific skill and provide:
 
@@ -124,24 +88,299 @@ Return ONLY a JSON object:
 }
 
 Be CRITICAL and HONEST. Don't inflate scores. If evidence is weak, say so."""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Skill to evaluate: {skill_name}\n\nEvidence:\n\n{context}"
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.2,  # Low temperature for consistent scoring
-                max_tokens=1500
+
+_SKILL_SYSTEM_MESSAGE = {"role": "system", "content": _SKILL_SYSTEM_PROMPT}
+
+# Batch scoring of several skills against the whole profile
+_BATCH_SYSTEM_PROMPT = """You are an expert technical recruiter evaluating candidate skills.
+
+Analyze the provided profile data and score EACH skill in the list.
+
+For EACH skill, provide:
+- confidence_score (0-100): How confident you are they have this skill
+- proficiency_level: beginner|intermediate|advanced|expert
+- years_experience: Estimated years (1-20+)
+- evidence_quality: low|medium|high|excellent
+- reasoning: Brief explanation
+
+Return a JSON object with a "skills" array:
+{
+  "skills": [
+    {
+      "skill": "Python",
+      "confidence_score": 90,
+      "proficiency_level": "advanced",
+      "years_experience": 6,
+      "evidence_quality": "excellent",
+      "reasoning": "Strong evidence across multiple projects...",
+      "data_sources_used": ["github_readme", "commits"],
+      "key_evidence": ["Built ML pipeline in Python", "300+ Python commits"]
+    },
+    ...
+  ],
+  "overall_assessment": "Brief overall technical assessment"
+}
+
+Be CRITICAL. Only high scores for clear evidence."""
+
+_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": _BATCH_SYSTEM_PROMPT}
+
+# Overall profile quality
+_PROFILE_SYSTEM_PROMPT = """You are a senior technical recruiter evaluating a candidate's overall profile quality.
+
+Analyze the COMPLETENESS, DEPTH, and CREDIBILITY of the candidate's professional profile.
+
+Consider:
+1. **Data Completeness**: How much quality data is available across sources?
+2. **Technical Depth**: Evidence of real technical expertise vs surface-level claims
+3. **Professional Presence**: Online visibility, community contributions, thought leadership
+4. **Consistency**: Do different sources tell the same story?
+5. **Recency**: Is the profile active and up-to-date?
+6. **Verifiability**: Can claims be verified through code, articles, projects?
+
+Return a JSON object:
+{
+  "overall_quality_score": 85,
+  "profile_completeness": 90,
+  "data_richness": "excellent",
+  "technical_depth": "high",
+  "professional_presence": "high",
+  "activity_level": "very_active|active|moderate|low",
+  "strengths": [
+    "Strong GitHub presence with well-documented projects",
+    "Active contributor to open source"
+  ],
+  "areas_for_improvement": [
+    "Limited web presence and articles",
+    "LinkedIn profile could be more detailed"
+  ],
+  "red_flags": [
+    "Any concerning inconsistencies or gaps"
+  ],
+  "summary": "2-3 sentence overall assessment",
+  "hirability_score": 85,
+  "recommended_for": ["senior engineer", "tech lead"],
+  "data_sources_quality": {
+    "github": "excellent|good|fair|poor|missing",
+    "linkedin": "excellent|good|fair|poor|missing",
+    "web_mentions": "excellent|good|fair|poor|missing",
+    "cv": "excellent|good|fair|poor|missing"
+  }
+}
+
+Be HONEST and CRITICAL."""
+
+_PROFILE_SYSTEM_MESSAGE = {"role": "system", "content": _PROFILE_SYSTEM_PROMPT}
+
+
+# Read-only templates for results produced without GPT. Sequences are tuples so
+# every copy can share them; callers only get a fresh top-level dict
+_FALLBACK_SKILL_TEMPLATE = MappingProxyType({
+    "confidence_score": 50,
+    "proficiency_level": "intermediate",
+    "years_experience": 2,
+    "evidence_quality": "medium",
+    "reasoning": "GPT analysis unavailable - using fallback score",
+    "data_sources_used": (),
+    "key_evidence": (),
+    "red_flags": ("Analysis unavailable",),
+})
+
+_NO_EVIDENCE_SKILL_TEMPLATE = MappingProxyType({
+    "confidence_score": 15,
+    "proficiency_level": "beginner",
+    "years_experience": 0,
+    "evidence_quality": "low",
+    "reasoning": "No evidence found across sources",
+    "data_sources_used": (),
+    "key_evidence": (),
+    "red_flags": ("No supporting evidence in CV, GitHub, LinkedIn or web mentions",),
+})
+
+_FALLBACK_PROFILE_TEMPLATE = MappingProxyType({
+    "overall_quality_score": 50,
+    "profile_completeness": 50,
+    "data_richness": "fair",
+    "technical_depth": "medium",
+    "professional_presence": "medium",
+    "activity_level": "moderate",
+    "strengths": ("Profile data available",),
+    "areas_for_improvement": ("Analysis unavailable",),
+    "red_flags": (),
+    "summary": "Profile quality analysis unavailable",
+    "hirability_score": 50,
+    "recommended_for": ("software engineer",),
+})
+
+
+class _Clock:
+    """
+    Timestamp source for scored_at/evaluated_at.
+
+    Results produced within the same millisecond share one formatted
+    timestamp instead of each paying for datetime.now().isoformat().
+    """
+
+    __slots__ = ("_last_ns", "_last_iso")
+
+    REFRESH_NS = 1_000_000
+
+    def __init__(self):
+        self._last_ns = 0
+        self._last_iso = ""
+
+    def iso(self) -> str:
+        """Current local time in ISO 8601, refreshed at most once per millisecond"""
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_ns >= self.REFRESH_NS or not self._last_iso:
+            self._last_ns = now_ns
+            self._last_iso = datetime.now().isoformat()
+        return self._last_iso
+
+
+class GPTScoringService(OpenAIServiceBase):
+    """AI-driven skill confidence scoring using GPT-4o"""
+
+    # Above this many skills, score_multiple_skills fans out per-skill requests
+    # instead of asking for one large batch JSON response
+    BATCH_MAX_SKILLS = 25
+
+    # Mixed into every cache key; bump when prompts or the model change so
+    # stale scores are not served
+    CACHE_VERSION = "gpt-4o:4"
+    CACHE_MAX_ENTRIES = 1024
+
+    # Output budgets. Each JSON schema is bounded, so these sit comfortably above
+    # a complete answer while keeping runaway generations short
+    SKILL_MAX_TOKENS = 800
+    BATCH_BASE_TOKENS = 200
+    BATCH_TOKENS_PER_SKILL = 150
+    BATCH_MAX_TOKENS = 4000
+
+    # Input budget for the profile-wide context, in characters (~4 per token)
+    CONTEXT_MAX_CHARS = 4000
+
+    def __init__(self):
+        """Initialize OpenAI client"""
+        super().__init__()
+
+        # Futures for GPT requests currently in flight, by cache key (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Batch requests still running after their caller stopped consuming scores
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Shared scored_at/evaluated_at timestamps
+        self._clock = _Clock()
+
+        if not settings.OPENAI_API_KEY:
+            logger.warning("OpenAI API key not configured")
+            self.client = None
+        else:
+            # Pooled keep-alive HTTP/2 connections, sized to the concurrency cap.
+            # Retries are handled by _call_gpt, not stacked on top of the SDK's own.
+            # The pool belongs to the application's event loop: callers must await
+            # the service from that loop (never via asyncio.run), and the lifespan
+            # handler closes it on shutdown
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_CONCURRENCY,
+                    max_keepalive_connections=settings.OPENAI_CONCURRENCY
+                )
+            )
+            self.client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self._http_client,
+                max_retries=0
+            )
+            logger.info("GPT Scoring Service initialized")
+
+    async def score_skill_confidence(
+        self,
+        skill_name: str,
+        github_data: Optional[Dict[str, Any]] = None,
+        linkedin_data: Optional[Dict[str, Any]] = None,
+        web_mentions: Optional[List[Dict[str, Any]]] = None,
+        cv_data: Optional[Dict[str, Any]] = None,
+        evidence_index: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Score a single skill using GPT-4o analysis of all available data.
+
+        Args:
+            skill_name: Name of the skill to score
+            github_data: GitHub profile and repository data (with README/commit samples)
+            linkedin_data: LinkedIn profile data
+            web_mentions: List of web mentions/articles
+            cv_data: CV/resume data
+            evidence_index: Prebuilt _build_evidence_index result to share across skills
+
+        Returns:
+            Dict containing:
+                - confidence_score: 0-100 (how confident we are this is a real skill)
+                - proficiency_level: beginner|intermediate|advanced|expert
+                - years_experience: Estimated years (1-20+)
+                - evidence_quality: low|medium|high|excellent
+                - reasoning: Explanation of the score
+                - data_sources_used: List of sources that contributed
+        """
+        if not self.client:
+            logger.error("OpenAI client not initialized")
+            return self._fallback_skill_score(skill_name)
+
+        try:
+            # Prepare context for GPT
+            context, evidence_count = self._build_skill_context(
+                skill_name, github_data, linkedin_data, web_mentions, cv_data,
+                evidence_index
             )
 
-            result = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT scored skill '{skill_name}': {result['confidence_score']}%")
+            # Nothing for GPT to weigh: don't pay for a call to say so
+            if not evidence_count:
+                return self._no_evidence_skill_score(skill_name)
+
+            # Identical evidence gets an identical score; skip the API call
+            cache_key = self._cache_key(skill_name, context)
+            cached = self._cache_get(cache_key)
+            if cached is None:
+                # The same evidence may already be being scored; share that call
+                cached = await self._wait_inflight(cache_key)
+            if cached is not None:
+                return {**cached, "scored_at": self._clock.iso()}
+
+            self._start_inflight(cache_key)
+            try:
+                # Call GPT-4o for skill-specific analysis
+                response = await self._call_gpt(
+                    model="gpt-4o",
+                    messages=[
+                        _SKILL_SYSTEM_MESSAGE,
+                        {
+                            "role": "user",
+                            "content": f"Evidence:\n\n{context}\n\n---\nSkill to evaluate: {skill_name}"
+                        }
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.2,  # Low temperature for consistent scoring
+                    max_tokens=self.SKILL_MAX_TOKENS
+                )
+
+                if response.choices[0].finish_reason == "length":
+                    logger.warning(f"GPT response for '{skill_name}' hit max_tokens={self.SKILL_MAX_TOKENS}")
+
+                result = orjson.loads(response.choices[0].message.content)
+                logger.info(f"GPT scored skill '{skill_name}': {result['confidence_score']}%")
+
+                result = {"skill": skill_name, **result}
+                self._cache_put(cache_key, result)
+            finally:
+                self._finish_inflight(cache_key)
 
             return {
-                "skill": skill_name,
                 **result,
-                "scored_at": datetime.now().isoformat()
+                "scored_at": self._clock.iso()
             }
 
         except Exception as e:
@@ -169,9 +408,86 @@ Be CRITICAL and HONEST. Don't inflate scores. If evidence is weak, say so."""
         Returns:
             List of skill scores
         """
+        # Too many skills for one response: score them concurrently instead
+        if self.client and len(skills) > self.BATCH_MAX_SKILLS:
+            return await self.score_skills_parallel(
+                skills, github_data, linkedin_data, web_mentions, cv_data
+            )
+
+        return [
+            score async for score in self.stream_multiple_skills(
+                skills, github_data, linkedin_data, web_mentions, cv_data
+            )
+        ]
+
+    async def stream_multiple_skills(
+        self,
+        skills: List[str],
+        github_data: Optional[Dict[str, Any]] = None,
+        linkedin_data: Optional[Dict[str, Any]] = None,
+        web_mentions: Optional[List[Dict[str, Any]]] = None,
+        cv_data: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Score multiple skills, yielding each score as soon as it is available.
+
+        The batch response is streamed and each object in its "skills" array
+        is yielded once GPT closes it, so callers can store or display scores
+        while the rest are still being generated. Skills left unscored by an
+        error are yielded as fallback scores.
+
+        Args:
+            skills: List of skill names to score
+            github_data: GitHub data
+            linkedin_data: LinkedIn data
+            web_mentions: Web mentions
+            cv_data: CV data
+
+        Yields:
+            Skill score dicts
+        """
         if not self.client:
             logger.error("OpenAI client not initialized")
-            return [self._fallback_skill_score(skill) for skill in skills]
+            scored_at = self._clock.iso()
+            for skill in skills:
+                yield self._fallback_skill_score(skill, scored_at)
+            return
+
+        # Too many skills for one response: yield per-skill scores as they finish
+        if len(skills) > self.BATCH_MAX_SKILLS:
+            evidence_index = self._try_build_evidence_index(
+                github_data, linkedin_data, web_mentions, cv_data
+            )
+            for future in asyncio.as_completed([
+                self.score_skill_confidence(
+                    skill, github_data, linkedin_data, web_mentions, cv_data,
+                    evidence_index
+                )
+                for skill in skills
+            ]):
+                yield await future
+            return
+
+        # Skills without any evidence are scored locally; only the rest go to GPT
+        evidence_index = self._try_build_evidence_index(
+            github_data, linkedin_data, web_mentions, cv_data
+        )
+        if evidence_index is not None:
+            evidenced = []
+            for skill in skills:
+                _, evidence_count = self._build_skill_context(
+                    skill, github_data, linkedin_data, web_mentions, cv_data,
+                    evidence_index
+                )
+                if evidence_count:
+                    evidenced.append(skill)
+                else:
+                    yield self._no_evidence_skill_score(skill)
+            if not evidenced:
+                return
+            skills = evidenced
+
+        scored = set()
 
         try:
             # Prepare comprehensive context once for all skills
@@ -179,66 +495,207 @@ Be CRITICAL and HONEST. Don't inflate scores. If evidence is weak, say so."""
                 github_data, linkedin_data, web_mentions, cv_data
             )
 
-            # Batch analyze all skills
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an expert technical recruiter evaluating candidate skills.
+            cache_key = self._cache_key("\0".join(sorted(skills)), context)
+            cached = self._cache_get(cache_key)
+            if cached is None:
+                cached = await self._wait_inflight(cache_key)
+            if cached is not None:
+                scored_at = self._clock.iso()
+                for score in cached:
+                    score["scored_at"] = scored_at
+                    yield score
+                return
+
+            # The request runs in its own task and hands scores over through a
+            # queue, so the concurrency slot is released as soon as the response
+            # is complete, however slowly the caller consumes the scores
+            scores: "asyncio.Queue[Any]" = asyncio.Queue()
+            self._start_inflight(cache_key)
+            task = asyncio.create_task(
+                self._stream_batch_scores(skills, context, cache_key, scores)
+            )
+            try:
+                while True:
+                    score = await scores.get()
+                    if score is None:
+                        break
+                    if isinstance(score, Exception):
+                        raise score
+                    scored.add(score.get("skill"))
+                    yield score
+            finally:
+                if not task.done():
+                    # Abandoned by the caller: let the request finish and be cached
+                    self._background_tasks.add(task)
+                    task.add_done_callback(self._background_tasks.discard)
 
-Analyze the provided profile data and score EACH skill in the list.
+        except Exception as e:
+            logger.error(f"Error scoring multiple skills: {e}")
+            scored_at = self._clock.iso()
+            for skill in skills:
+                if skill not in scored:
+                    yield self._fallback_skill_score(skill, scored_at)
 
-For EACH skill, provide:
-- confidence_score (0-100): How confident you are they have this skill
-- proficiency_level: beginner|intermediate|advanced|expert
-- years_experience: Estimated years (1-20+)
-- evidence_quality: low|medium|high|excellent
-- reasoning: Brief explanation
+    async def _stream_batch_scores(
+        self,
+        skills: List[str],
+        context: str,
+        cache_key: str,
+        scores: "asyncio.Queue[Any]"
+    ) -> None:
+        """
+        Stream one batch scoring request, putting each skill score on the queue
+        as GPT completes it.
 
-Return a JSON object with a "skills" array:
-{
-  "skills": [
-    {
-      "skill": "Python",
-      "confidence_score": 90,
-      "proficiency_level": "advanced",
-      "years_experience": 6,
-      "evidence_quality": "excellent",
-      "reasoning": "Strong evidence across multiple projects...",
-      "data_sources_used": ["github_readme", "commits"],
-      "key_evidence": ["Built ML pipeline in Python", "300+ Python commits"]
-    },
-    ...
-  ],
-  "overall_assessment": "Brief overall technical assessment"
-}
+        The queue ends with None; an error is put on it before that. The
+        in-flight entry for cache_key is always finished.
+        """
+        try:
+            # Output grows with the number of skills; budget for that, not the worst case
+            max_tokens = min(
+                self.BATCH_MAX_TOKENS,
+                self.BATCH_BASE_TOKENS + self.BATCH_TOKENS_PER_SKILL * len(skills)
+            )
 
-Be CRITICAL. Only high scores for clear evidence."""
-                    },
+            # Batch analyze all skills
+            stream = await self._call_gpt(
+                model="gpt-4o",
+                messages=[
+                    _BATCH_SYSTEM_MESSAGE,
                     {
                         "role": "user",
-                        "content": f"Skills to evaluate: {', '.join(skills)}\n\nCandidate Profile:\n\n{context}"
+                        "content": f"Candidate Profile:\n\n{context}\n\n---\nSkills to evaluate: {', '.join(skills)}"
                     }
                 ],
                 response_format={"type": "json_object"},
                 temperature=0.2,
-                max_tokens=4000
+                max_tokens=max_tokens,
+                stream=True
             )
 
-            result = json.loads(response.choices[0].message.content)
+            # One timestamp for the whole batch
+            scored_at = self._clock.iso()
+            content = []
+            pos = 0
+            finish_reason = None
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                content.append(delta)
+
+                # Only a closing brace can complete another skill object
+                if '}' not in delta:
+                    continue
+                completed, pos = self._parse_streamed_skills("".join(content), pos)
+                for score in completed:
+                    score["scored_at"] = scored_at
+                    scores.put_nowait(score)
+
+            if finish_reason == "length":
+                logger.warning(f"GPT batch response for {len(skills)} skills hit max_tokens={max_tokens}")
+
+            result = orjson.loads("".join(content))
             skills_scores = result.get("skills", [])
+            self._cache_put(cache_key, skills_scores)
+            logger.info(f"GPT scored {len(skills_scores)} skills")
+        except Exception as e:
+            scores.put_nowait(e)
+        finally:
+            self._finish_inflight(cache_key)
+            scores.put_nowait(None)
 
-            # Add timestamp
-            for score in skills_scores:
-                score["scored_at"] = datetime.now().isoformat()
+    @staticmethod
+    def _parse_streamed_skills(buffer: str, pos: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Decode the skill objects completed so far in a partial batch response.
 
-            logger.info(f"GPT scored {len(skills_scores)} skills")
-            return skills_scores
+        Args:
+            buffer: Response text received so far
+            pos: Offset returned by the previous call (0 before the array starts)
+
+        Returns:
+            Tuple of (newly completed skill dicts, offset to resume from)
+        """
+        if not pos:
+            key = buffer.find('"skills"')
+            if key == -1:
+                return [], 0
+            start = buffer.find('[', key)
+            if start == -1:
+                return [], 0
+            pos = start + 1
+
+        completed = []
+        end = len(buffer)
+        while True:
+            while pos < end and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= end or buffer[pos] != '{':
+                # Out of data, or the array has closed
+                break
+            try:
+                score, pos = _JSON_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Object still being generated
+                break
+            completed.append(score)
+
+        return completed, pos
+
+    async def score_skills_parallel(
+        self,
+        skills: List[str],
+        github_data: Optional[Dict[str, Any]] = None,
+        linkedin_data: Optional[Dict[str, Any]] = None,
+        web_mentions: Optional[List[Dict[str, Any]]] = None,
+        cv_data: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score skills concurrently with one focused GPT-4o request per skill.
+
+        Total latency is roughly that of the slowest request rather than the
+        sum; the shared semaphore keeps at most OPENAI_CONCURRENCY in flight.
+
+        Args:
+            skills: List of skill names to score
+            github_data: GitHub data
+            linkedin_data: LinkedIn data
+            web_mentions: Web mentions
+            cv_data: CV data
 
+        Returns:
+            List of skill scores, in the same order as skills
+        """
+        # Evidence is lowercased once and shared by every per-skill request
+        evidence_index = self._try_build_evidence_index(
+            github_data, linkedin_data, web_mentions, cv_data
+        )
+
+        return list(await asyncio.gather(*(
+            self.score_skill_confidence(
+                skill, github_data, linkedin_data, web_mentions, cv_data,
+                evidence_index
+            )
+            for skill in skills
+        )))
+
+    def _try_build_evidence_index(
+        self,
+        github_data: Optional[Dict[str, Any]],
+        linkedin_data: Optional[Dict[str, Any]],
+        web_mentions: Optional[List[Dict[str, Any]]],
+        cv_data: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Build the shared evidence index, or None so each skill reports its own error"""
+        try:
+            return self._build_evidence_index(github_data, linkedin_data, web_mentions, cv_data)
         except Exception as e:
-            logger.error(f"Error scoring multiple skills: {e}")
-            return [self._fallback_skill_score(skill) for skill in skills]
+            logger.warning(f"Could not index candidate evidence: {e}")
+            return None
 
     async def calculate_profile_quality(
         self,
@@ -283,55 +740,10 @@ Be CRITICAL. Only high scores for clear evidence."""
                 skills_summary = self._summarize_skills_scores(skills_scores)
                 context += f"\n\nSkills Assessment Summary:\n{skills_summary}"
 
-            response = self.client.chat.completions.create(
+            response = await self._call_gpt(
                 model="gpt-4o",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a senior technical recruiter evaluating a candidate's overall profile quality.
-
-Analyze the COMPLETENESS, DEPTH, and CREDIBILITY of the candidate's professional profile.
-
-Consider:
-1. **Data Completeness**: How much quality data is available across sources?
-2. **Technical Depth**: Evidence of real technical expertise vs surface-level claims
-3. **Professional Presence**: Online visibility, community contributions, thought leadership
-4. **Consistency**: Do different sources tell the same story?
-5. **Recency**: Is the profile active and up-to-date?
-6. **Verifiability**: Can claims be verified through code, articles, projects?
-
-Return a JSON object:
-{
-  "overall_quality_score": 85,
-  "profile_completeness": 90,
-  "data_richness": "excellent",
-  "technical_depth": "high",
-  "professional_presence": "high",
-  "activity_level": "very_active|active|moderate|low",
-  "strengths": [
-    "Strong GitHub presence with well-documented projects",
-    "Active contributor to open source"
-  ],
-  "areas_for_improvement": [
-    "Limited web presence and articles",
-    "LinkedIn profile could be more detailed"
-  ],
-  "red_flags": [
-    "Any concerning inconsistencies or gaps"
-  ],
-  "summary": "2-3 sentence overall assessment",
-  "hirability_score": 85,
-  "recommended_for": ["senior engineer", "tech lead"],
-  "data_sources_quality": {
-    "github": "excellent|good|fair|poor|missing",
-    "linkedin": "excellent|good|fair|poor|missing",
-    "web_mentions": "excellent|good|fair|poor|missing",
-    "cv": "excellent|good|fair|poor|missing"
-  }
-}
-
-Be HONEST and CRITICAL."""
-                    },
+                    _PROFILE_SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": f"Evaluate this candidate's profile:\n\n{context}"
@@ -342,8 +754,8 @@ Be HONEST and CRITICAL."""
                 max_tokens=2000
             )
 
-            result = json.loads(response.choices[0].message.content)
-            result["evaluated_at"] = datetime.now().isoformat()
+            result = orjson.loads(response.choices[0].message.content)
+            result["evaluated_at"] = self._clock.iso()
 
             logger.info(f"Profile quality score: {result.get('overall_quality_score', 0)}")
             return result
@@ -352,24 +764,146 @@ Be HONEST and CRITICAL."""
             logger.error(f"Error calculating profile quality: {e}")
             return self._fallback_profile_quality()
 
+    def _start_inflight(self, key: str) -> None:
+        """Mark a GPT request for key as in flight so duplicates can wait on it"""
+        self._inflight[key] = asyncio.get_running_loop().create_future()
+
+    def _finish_inflight(self, key: str) -> None:
+        """Release waiters on key with the cached result (None if the request failed)"""
+        future = self._inflight.pop(key)
+        if not future.done():
+            future.set_result(self._cache.get(key))
+
+    async def _wait_inflight(self, key: str) -> Optional[Any]:
+        """
+        Wait for an identical in-flight GPT request and return a copy of its result.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            The result, or None if no identical request is in flight
+
+        Raises:
+            RuntimeError: If the in-flight request failed
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            return None
+        # Shielded so one waiter being cancelled does not cancel the shared future
+        data = await asyncio.shield(future)
+        if data is None:
+            raise RuntimeError("Identical in-flight GPT request failed")
+        return orjson.loads(data)
+
+    def _build_evidence_index(
+        self,
+        github_data: Optional[Dict[str, Any]],
+        linkedin_data: Optional[Dict[str, Any]],
+        web_mentions: Optional[List[Dict[str, Any]]],
+        cv_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Lowercase every searchable piece of candidate evidence once.
+
+        The index is shared by all skills of a candidate, so per-skill context
+        preparation only runs substring checks instead of re-lowercasing every
+        README, commit message and article for each skill.
+
+        Args:
+            github_data: GitHub data
+            linkedin_data: LinkedIn data
+            web_mentions: Web mentions
+            cv_data: CV data
+
+        Returns:
+            Dict of lowercased evidence, paired with the original records
+        """
+        index: Dict[str, Any] = {}
+
+        if cv_data and cv_data.get('skills'):
+            index['cv_skills'] = {s.lower() for s in cv_data['skills']}
+
+        if github_data:
+            if github_data.get('languages'):
+                index['languages'] = [
+                    (lang.lower(), count) for lang, count in github_data['languages'].items()
+                ]
+            if github_data.get('readme_samples'):
+                index['readmes'] = [
+                    (readme.get('content', '').lower(), readme)
+                    for readme in github_data['readme_samples']
+                ]
+            if github_data.get('commit_samples'):
+                index['commits'] = [
+                    (commit.get('message', '').lower(), commit)
+                    for commit in github_data['commit_samples']
+                ]
+
+        if linkedin_data:
+            if linkedin_data.get('skills'):
+                index['linkedin_skills'] = {s.lower() for s in linkedin_data['skills']}
+            if linkedin_data.get('experience'):
+                index['experience'] = [
+                    (exp.get('description', '').lower(), exp)
+                    for exp in linkedin_data['experience']
+                ]
+            if linkedin_data.get('headline'):
+                index['headline'] = linkedin_data['headline'].lower()
+
+        if web_mentions:
+            index['web_mentions'] = [
+                (m.get('title', '').lower(), m.get('content', '').lower(), m)
+                for m in web_mentions
+            ]
+
+        return index
+
     def _prepare_skill_context(
         self,
         skill_name: str,
         github_data: Optional[Dict[str, Any]],
         linkedin_data: Optional[Dict[str, Any]],
         web_mentions: Optional[List[Dict[str, Any]]],
-        cv_data: Optional[Dict[str, Any]]
+        cv_data: Optional[Dict[str, Any]],
+        evidence_index: Optional[Dict[str, Any]] = None
     ) -> str:
         """Prepare focused context for a specific skill"""
+        context, _ = self._build_skill_context(
+            skill_name, github_data, linkedin_data, web_mentions, cv_data, evidence_index
+        )
+        return context
+
+    def _build_skill_context(
+        self,
+        skill_name: str,
+        github_data: Optional[Dict[str, Any]],
+        linkedin_data: Optional[Dict[str, Any]],
+        web_mentions: Optional[List[Dict[str, Any]]],
+        cv_data: Optional[Dict[str, Any]],
+        evidence_index: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, int]:
+        """
+        Prepare focused context for a specific skill and count its evidence.
+
+        Returns:
+            Tuple of (context text, number of evidence items found for the skill)
+        """
+        if evidence_index is None:
+            evidence_index = self._build_evidence_index(
+                github_data, linkedin_data, web_mentions, cv_data
+            )
+        skill_lower = skill_name.lower()
+
+        evidence_count = 0
         context_parts = []
-        context_parts.append(f"SKILL TO EVALUATE: {skill_name}\n")
 
         # CV mentions
         if cv_data:
             context_parts.append("=== CV/RESUME DATA ===")
-            if cv_data.get('skills'):
-                if skill_name.lower() in [s.lower() for s in cv_data['skills']]:
-                    context_parts.append(f"✓ '{skill_name}' explicitly listed in CV")
+            if skill_lower in evidence_index.get('cv_skills', ()):
+                context_parts.append(f"✓ '{skill_name}' explicitly listed in CV")
+                evidence_count += 1
             if cv_data.get('work_history'):
                 context_parts.append(f"\nWork History: {len(cv_data['work_history'])} positions")
                 for job in cv_data['work_history'][:3]:
@@ -380,34 +914,32 @@ Be HONEST and CRITICAL."""
             context_parts.append("\n=== GITHUB EVIDENCE ===")
 
             # Check if skill appears in languages
-            if github_data.get('languages'):
-                skill_lower = skill_name.lower()
-                for lang, count in github_data['languages'].items():
-                    if skill_lower in lang.lower() or lang.lower() in skill_lower:
-                        context_parts.append(f"✓ Used in {count} repositories (primary language)")
+            for lang_lower, count in evidence_index.get('languages', ()):
+                if skill_lower in lang_lower or lang_lower in skill_lower:
+                    context_parts.append(f"✓ Used in {count} repositories (primary language)")
+                    evidence_count += 1
 
             # Check README samples
-            if github_data.get('readme_samples'):
-                skill_mentions = []
-                for readme in github_data['readme_samples']:
-                    content = readme.get('content', '').lower()
-                    if skill_name.lower() in content:
-                        skill_mentions.append(f"- {readme['repo_name']}: {readme.get('repo_description', '')[:100]}")
-
-                if skill_mentions:
-                    context_parts.append(f"\n✓ Mentioned in {len(skill_mentions)} project READMEs:")
-                    context_parts.extend(skill_mentions[:3])
+            skill_mentions = [
+                f"- {readme['repo_name']}: {readme.get('repo_description', '')[:100]}"
+                for content, readme in evidence_index.get('readmes', ())
+                if skill_lower in content
+            ]
+            if skill_mentions:
+                context_parts.append(f"\n✓ Mentioned in {len(skill_mentions)} project READMEs:")
+                evidence_count += 1
+                context_parts.extend(skill_mentions[:3])
 
             # Check commit messages
-            if github_data.get('commit_samples'):
-                skill_commits = [
-                    c for c in github_data['commit_samples']
-                    if skill_name.lower() in c.get('message', '').lower()
-                ]
-                if skill_commits:
-                    context_parts.append(f"\n✓ Found in {len(skill_commits)} commit messages")
-                    for commit in skill_commits[:3]:
-                        context_parts.append(f"  - {commit['message'][:80]}...")
+            skill_commits = [
+                commit for message, commit in evidence_index.get('commits', ())
+                if skill_lower in message
+            ]
+            if skill_commits:
+                context_parts.append(f"\n✓ Found in {len(skill_commits)} commit messages")
+                evidence_count += 1
+                for commit in skill_commits[:3]:
+                    context_parts.append(f"  - {commit['message'][:80]}...")
 
             # Commit statistics
             if github_data.get('commit_statistics'):
@@ -419,36 +951,35 @@ Be HONEST and CRITICAL."""
             context_parts.append("\n=== LINKEDIN EVIDENCE ===")
 
             # Check skills list
-            if linkedin_data.get('skills'):
-                if skill_name.lower() in [s.lower() for s in linkedin_data['skills']]:
-                    context_parts.append(f"✓ Listed in LinkedIn skills")
+            if skill_lower in evidence_index.get('linkedin_skills', ()):
+                context_parts.append(f"✓ Listed in LinkedIn skills")
+                evidence_count += 1
 
             # Check experience descriptions
-            if linkedin_data.get('experience'):
-                for exp in linkedin_data['experience']:
-                    desc = exp.get('description', '').lower()
-                    if skill_name.lower() in desc:
-                        context_parts.append(f"✓ Mentioned in {exp.get('title')} role")
+            for desc, exp in evidence_index.get('experience', ()):
+                if skill_lower in desc:
+                    context_parts.append(f"✓ Mentioned in {exp.get('title')} role")
+                    evidence_count += 1
 
             # Check headline/summary
-            if linkedin_data.get('headline'):
-                if skill_name.lower() in linkedin_data['headline'].lower():
-                    context_parts.append(f"✓ Featured in professional headline")
+            headline = evidence_index.get('headline')
+            if headline and skill_lower in headline:
+                context_parts.append(f"✓ Featured in professional headline")
+                evidence_count += 1
 
         # Web mentions
-        if web_mentions:
-            skill_articles = [
-                m for m in web_mentions
-                if skill_name.lower() in m.get('title', '').lower() or
-                   skill_name.lower() in m.get('content', '').lower()
-            ]
-            if skill_articles:
-                context_parts.append(f"\n=== WEB MENTIONS ({len(skill_articles)} found) ===")
-                for article in skill_articles[:2]:
-                    context_parts.append(f"- {article.get('title')}")
-                    context_parts.append(f"  {article.get('snippet', '')[:150]}...")
+        skill_articles = [
+            m for title, content, m in evidence_index.get('web_mentions', ())
+            if skill_lower in title or skill_lower in content
+        ]
+        if skill_articles:
+            evidence_count += len(skill_articles)
+            context_parts.append(f"\n=== WEB MENTIONS ({len(skill_articles)} found) ===")
+            for article in skill_articles[:2]:
+                context_parts.append(f"- {article.get('title')}")
+                context_parts.append(f"  {article.get('snippet', '')[:150]}...")
 
-        return "\n".join(context_parts)
+        return "\n".join(context_parts), evidence_count
 
     def _prepare_comprehensive_context(
         self,
@@ -457,132 +988,182 @@ Be HONEST and CRITICAL."""
         web_mentions: Optional[List[Dict[str, Any]]],
         cv_data: Optional[Dict[str, Any]]
     ) -> str:
-        """Prepare comprehensive context for profile-wide analysis"""
-        context_parts = []
+        """
+        Prepare comprehensive context for profile-wide analysis.
+
+        Uses terse section tags and whitespace-collapsed, length-capped text
+        fields, since input tokens drive both the cost and latency of the call.
+        The whole context is kept within CONTEXT_MAX_CHARS by dropping free-text
+        lines, least valuable first (web snippets, LinkedIn summary, commits,
+        then READMEs).
+        """
+        # (drop priority, line); 0 is never dropped, higher numbers go first
+        context_parts: List[Tuple[int, str]] = []
+
+        def add(line: str, priority: int = 0) -> None:
+            context_parts.append((priority, line))
 
         # GitHub section
         if github_data:
-            context_parts.append("=== GITHUB PROFILE ===")
-            context_parts.append(f"Username: {github_data.get('username')}")
-            context_parts.append(f"Public Repos: {github_data.get('public_repos', 0)}")
-            context_parts.append(f"Followers: {github_data.get('followers', 0)}")
+            add(
+                f"[GitHub] user={github_data.get('username')} "
+                f"repos={github_data.get('public_repos', 0)} "
+                f"followers={github_data.get('followers', 0)}"
+            )
 
             if github_data.get('bio'):
-                context_parts.append(f"Bio: {github_data['bio']}")
+                add(f"bio: {squash_text(github_data['bio'], 200)}")
 
             if github_data.get('languages'):
-                context_parts.append(f"\nLanguages: {dict(list(github_data['languages'].items())[:5])}")
+                languages = ", ".join(
+                    f"{lang}:{count}" for lang, count in islice(github_data['languages'].items(), 5)
+                )
+                add(f"languages: {languages}")
 
             # README samples
             if github_data.get('readme_samples'):
-                context_parts.append(f"\n--- README Samples ({len(github_data['readme_samples'])} projects) ---")
-                for readme in github_data['readme_samples'][:3]:
-                    context_parts.append(f"\n{readme['repo_name']} ({readme.get('stars', 0)} ⭐)")
-                    context_parts.append(f"{readme['content'][:300]}...")
+                readmes = github_data['readme_samples']
+                add(f"readmes ({min(len(readmes), 3)} of {len(readmes)}):")
+                for readme in readmes[:3]:
+                    add(
+                        f"- {readme['repo_name']} ({readme.get('stars', 0)}★): "
+                        f"{squash_text(readme['content'], 300)}",
+                        priority=1
+                    )
 
             # Commit samples
             if github_data.get('commit_samples'):
-                context_parts.append(f"\n--- Recent Commits (sample of {len(github_data['commit_samples'])}) ---")
-                for commit in github_data['commit_samples'][:10]:
-                    context_parts.append(f"- {commit['message'][:100]}")
+                commits = github_data['commit_samples']
+                add(f"commits ({min(len(commits), 10)} of {len(commits)}):")
+                for commit in commits[:10]:
+                    add(f"- {squash_text(commit['message'], 100)}", priority=2)
 
             # Commit stats
             if github_data.get('commit_statistics'):
                 stats = github_data['commit_statistics']
-                context_parts.append(f"\n--- Commit Patterns ---")
-                context_parts.append(f"Frequency: {stats.get('commit_frequency')}")
-                context_parts.append(f"Uses conventional commits: {stats.get('has_conventional_commits')}")
+                add(
+                    f"commit_frequency={stats.get('commit_frequency')} "
+                    f"conventional_commits={stats.get('has_conventional_commits')}"
+                )
 
         # LinkedIn section
         if linkedin_data:
-            context_parts.append("\n\n=== LINKEDIN PROFILE ===")
-            context_parts.append(f"Name: {linkedin_data.get('full_name')}")
+            add(f"[LinkedIn] name={linkedin_data.get('full_name')}")
             if linkedin_data.get('headline'):
-                context_parts.append(f"Headline: {linkedin_data['headline']}")
+                add(f"headline: {squash_text(linkedin_data['headline'], 200)}")
             if linkedin_data.get('summary'):
-                context_parts.append(f"Summary: {linkedin_data['summary'][:300]}...")
+                add(f"summary: {squash_text(linkedin_data['summary'], 300)}", priority=3)
 
             if linkedin_data.get('experience'):
-                context_parts.append(f"\nExperience: {len(linkedin_data['experience'])} positions")
-                for exp in linkedin_data['experience'][:3]:
-                    context_parts.append(f"- {exp.get('title')} at {exp.get('company')}")
+                experience = linkedin_data['experience']
+                positions = "; ".join(
+                    f"{exp.get('title')} @ {exp.get('company')}" for exp in experience[:3]
+                )
+                add(f"experience ({len(experience)} positions): {positions}")
 
             if linkedin_data.get('skills'):
-                context_parts.append(f"\nSkills: {', '.join(linkedin_data['skills'][:10])}")
+                add(f"skills: {', '.join(linkedin_data['skills'][:10])}")
 
         # Web mentions section
         if web_mentions:
-            context_parts.append(f"\n\n=== WEB MENTIONS ({len(web_mentions)} found) ===")
+            add(f"[Web] {len(web_mentions)} mentions")
             for mention in web_mentions[:3]:
-                context_parts.append(f"\n- {mention.get('title')}")
-                context_parts.append(f"  Source: {mention.get('source_name')}")
-                context_parts.append(f"  {mention.get('snippet', '')[:200]}...")
+                add(
+                    f"- {mention.get('title')} ({mention.get('source_name')}): "
+                    f"{squash_text(mention.get('snippet', ''), 200)}",
+                    priority=4
+                )
 
         # CV section
         if cv_data:
-            context_parts.append("\n\n=== CV/RESUME ===")
+            add("[CV]")
             if cv_data.get('skills'):
-                context_parts.append(f"Listed Skills: {', '.join(cv_data['skills'][:15])}")
+                add(f"skills: {', '.join(cv_data['skills'][:15])}")
             if cv_data.get('work_history'):
-                context_parts.append(f"\nWork History: {len(cv_data['work_history'])} positions")
+                add(f"work_history: {len(cv_data['work_history'])} positions")
+
+        return self._fit_context_budget(context_parts)
+
+    def _fit_context_budget(self, context_parts: List[Tuple[int, str]]) -> str:
+        """
+        Join context lines, dropping the highest-priority-number lines (latest
+        first) until the result fits CONTEXT_MAX_CHARS.
 
-        return "\n".join(context_parts)
+        Args:
+            context_parts: (drop priority, line) pairs in output order
+
+        Returns:
+            str: Newline-joined context, cut at the budget if the never-dropped
+            lines alone exceed it
+        """
+        lines = [line for _, line in context_parts]
+        length = sum(len(line) + 1 for line in lines) - 1
+        if length <= self.CONTEXT_MAX_CHARS:
+            return "\n".join(lines)
+
+        kept = [True] * len(context_parts)
+        droppable = sorted(
+            (i for i, (priority, _) in enumerate(context_parts) if priority),
+            key=lambda i: (-context_parts[i][0], -i)
+        )
+        for i in droppable:
+            if length <= self.CONTEXT_MAX_CHARS:
+                break
+            kept[i] = False
+            length -= len(lines[i]) + 1
+
+        context = "\n".join(line for line, keep in zip(lines, kept) if keep)
+        return context[:self.CONTEXT_MAX_CHARS]
 
     def _summarize_skills_scores(self, skills_scores: List[Dict[str, Any]]) -> str:
         """Create a summary of skills scores for profile quality analysis"""
         if not skills_scores:
             return "No skills scored yet"
 
-        avg_confidence = sum(s.get('confidence_score', 0) for s in skills_scores) / len(skills_scores)
-
-        by_proficiency = {}
+        # Single pass over the scores
+        total_confidence = 0
+        high_confidence = 0
+        by_proficiency = Counter()
         for s in skills_scores:
-            level = s.get('proficiency_level', 'unknown')
-            by_proficiency[level] = by_proficiency.get(level, 0) + 1
+            confidence = s.get('confidence_score', 0)
+            total_confidence += confidence
+            if confidence >= 80:
+                high_confidence += 1
+            by_proficiency[s.get('proficiency_level', 'unknown')] += 1
 
-        high_confidence = [s for s in skills_scores if s.get('confidence_score', 0) >= 80]
+        avg_confidence = total_confidence / len(skills_scores)
 
         summary = [
             f"Total Skills Assessed: {len(skills_scores)}",
             f"Average Confidence: {avg_confidence:.1f}%",
-            f"High Confidence Skills (80+%): {len(high_confidence)}",
-            f"Proficiency Distribution: {by_proficiency}"
+            f"High Confidence Skills (80+%): {high_confidence}",
+            f"Proficiency Distribution: {dict(by_proficiency)}"
         ]
 
         return "\n".join(summary)
 
-    def _fallback_skill_score(self, skill_name: str) -> Dict[str, Any]:
-        """Fallback scoring when GPT is unavailable"""
+    def _fallback_skill_score(self, skill_name: str, scored_at: Optional[str] = None) -> Dict[str, Any]:
+        """Fallback scoring when GPT is unavailable (scored_at defaults to now)"""
         return {
             "skill": skill_name,
-            "confidence_score": 50,
-            "proficiency_level": "intermediate",
-            "years_experience": 2,
-            "evidence_quality": "medium",
-            "reasoning": "GPT analysis unavailable - using fallback score",
-            "data_sources_used": [],
-            "key_evidence": [],
-            "red_flags": ["Analysis unavailable"],
-            "scored_at": datetime.now().isoformat()
+            **_FALLBACK_SKILL_TEMPLATE,
+            "scored_at": scored_at or self._clock.iso()
+        }
+
+    def _no_evidence_skill_score(self, skill_name: str) -> Dict[str, Any]:
+        """Low score for a skill with no evidence in any source, without calling GPT"""
+        return {
+            "skill": skill_name,
+            **_NO_EVIDENCE_SKILL_TEMPLATE,
+            "scored_at": self._clock.iso()
         }
 
     def _fallback_profile_quality(self) -> Dict[str, Any]:
         """Fallback profile quality when GPT is unavailable"""
         return {
-            "overall_quality_score": 50,
-            "profile_completeness": 50,
-            "data_richness": "fair",
-            "technical_depth": "medium",
-            "professional_presence": "medium",
-            "activity_level": "moderate",
-            "strengths": ["Profile data available"],
-            "areas_for_improvement": ["Analysis unavailable"],
-            "red_flags": [],
-            "summary": "Profile quality analysis unavailable",
-            "hirability_score": 50,
-            "recommended_for": ["software engineer"],
+            **_FALLBACK_PROFILE_TEMPLATE,
             "data_sources_quality": {},
-            "evaluated_at": datetime.now().isoformat()
+            "evaluated_at": self._clock.iso()
         }
 
 
@@ -595,3 +1176,11 @@ def get_gpt_scoring_service() -> GPTScoringService:
     if _gpt_scoring_service is None:
         _gpt_scoring_service = GPTScoringService()
     return _gpt_scoring_service
+
+
+async def close_gpt_scoring_service() -> None:
+    """Close the GPT scoring service singleton's connections, if it was created"""
+    global _gpt_scoring_service
+    if _gpt_scoring_service is not None:
+        await _gpt_scoring_service.aclose()
+        _gpt_scoring_service = None
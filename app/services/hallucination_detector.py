@@ -2,14 +2,57 @@
 Hallucination Detector Service
 Identifies potentially false or exaggerated skills from AI analysis
 """
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import re
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Risk points added by each hallucination factor in analyze_skill
+_W_SINGLE_SOURCE = 30
+_W_NO_PRIMARY_SOURCE = 40
+_W_NOT_IN_CV = 15
+_W_VAGUE_SKILL = 25
+_W_NO_EVIDENCE = 35
+_W_PROFILE_INCONSISTENCY = 20
+_W_STALE_SKILL = 15
+
+# Recommendations by risk band (score >= 60, >= 40, >= 20, below 20)
+_RECOMMEND_EXCLUDE = "EXCLUDE - Likely hallucination, exclude from profile"
+_RECOMMEND_FLAG = "FLAG - Requires manual review and verification"
+_RECOMMEND_VERIFY = "VERIFY - Include but mark as unverified"
+_RECOMMEND_INCLUDE = "INCLUDE - Low risk, safe to include"
+
+# Bits for the sources skill_validation_service reports per skill. Sources not
+# listed still count towards the number of sources, they just get no bit
+_SRC_CV = 1 << 0
+_SRC_GITHUB = 1 << 1
+_SOURCE_BITS = {
+    "cv": _SRC_CV,
+    "github": _SRC_GITHUB,
+    "stackoverflow": 1 << 2,
+    "web_mentions": 1 << 3,
+    "blog": 1 << 4,
+}
+
+# Evidence counts checked by _check_evidence, most commonly present first
+_EVIDENCE_KEYS = ("repository_count", "commit_count", "articles_written", "stackoverflow_score")
+
+
+@lru_cache(maxsize=4096)
+def _activity_timestamp(last_activity: str) -> Optional[float]:
+    """POSIX timestamp of an ISO 8601 activity date, or None if it can't be parsed"""
+    try:
+        return datetime.fromisoformat(last_activity.replace('Z', '+00:00')).timestamp()
+    except Exception:
+        return None
+
+
 class HallucinationDetectorService:
     """
     Service for detecting skill hallucinations and false positives.
@@ -23,21 +66,42 @@ class HallucinationDetectorService:
     """
 
     # Known vague/generic skills that often indicate hallucinations
-    VAGUE_SKILLS = {
+    VAGUE_SKILLS = frozenset({
         "coding", "programming", "software", "development", "technology",
         "computer science", "it", "web", "mobile", "desktop",
         "frontend", "backend", "fullstack", "data", "analytics",
         "management", "leadership", "communication", "teamwork",
         "problem solving", "critical thinking", "agile", "scrum"
-    }
+    })
 
     # Skills that should have concrete evidence
-    REQUIRES_EVIDENCE = {
+    REQUIRES_EVIDENCE = frozenset({
         "machine learning", "deep learning", "artificial intelligence",
         "blockchain", "cryptocurrency", "quantum computing",
         "embedded systems", "robotics", "iot",
         "cybersecurity", "penetration testing", "ethical hacking"
-    }
+    })
+
+    # Skill keyword patterns, each with the languages a profile needs for
+    # skills matching it to be plausible. Each pattern is one C-level substring
+    # scan instead of an `in` test per keyword
+    INCONSISTENCY_RULES = (
+        # ML/DS skills require Python/R
+        (
+            re.compile("machine learning|deep learning|tensorflow|pytorch|keras"),
+            frozenset({"python", "r", "julia"})
+        ),
+        # Mobile skills require mobile languages
+        (
+            re.compile("ios|android|mobile|swift|kotlin"),
+            frozenset({"swift", "kotlin", "java", "react native", "flutter"})
+        ),
+        # Blockchain skills require relevant languages
+        (
+            re.compile("blockchain|solidity|smart contract|ethereum"),
+            frozenset({"solidity", "rust", "go", "javascript"})
+        ),
+    )
 
     def __init__(self):
         """Initialize hallucination detector"""
@@ -48,7 +112,9 @@ class HallucinationDetectorService:
         skill: str,
         sources: Dict[str, bool],
         evidence: Optional[Dict[str, any]] = None,
-        profile_context: Optional[Dict[str, any]] = None
+        profile_context: Optional[Dict[str, any]] = None,
+        now_ts: Optional[float] = None,
+        main_skills: Optional[FrozenSet[str]] = None
     ) -> Dict[str, any]:
         """
         Analyze a single skill for hallucination indicators.
@@ -58,6 +124,9 @@ class HallucinationDetectorService:
             sources: Dict of sources where skill was found
             evidence: Evidence data (repos, commits, articles, etc.)
             profile_context: Overall profile context
+            now_ts: Current POSIX time, shared across a skill list (defaults to now)
+            main_skills: profile_context's main skills from _profile_main_skills,
+                shared across a skill list (derived from profile_context if omitted)
 
         Returns:
             Analysis result with hallucination risk assessment
@@ -66,10 +135,20 @@ class HallucinationDetectorService:
         risk_factors = []
         is_hallucination = False
 
+        # Normalized once for every keyword check below
+        skill_lower = skill.lower().strip()
+
+        # One pass over the sources: how many found the skill, and which of them
+        source_count = 0
+        source_bits = 0
+        for source, found in sources.items():
+            if found:
+                source_count += 1
+                source_bits |= _SOURCE_BITS.get(source, 0)
+
         # Factor 1: Single source only (especially if AI-generated)
-        source_count = sum(1 for found in sources.values() if found)
         if source_count == 1:
-            risk_score += 30
+            risk_score += _W_SINGLE_SOURCE
             risk_factors.append({
                 "factor": "single_source",
                 "severity": "medium",
@@ -77,17 +156,17 @@ class HallucinationDetectorService:
             })
 
         # Factor 2: Not in CV but in AI analysis
-        if not sources.get("cv", False):
+        if not source_bits & _SRC_CV:
             # If also not in GitHub but in web/AI analysis
-            if not sources.get("github", False):
-                risk_score += 40
+            if not source_bits & _SRC_GITHUB:
+                risk_score += _W_NO_PRIMARY_SOURCE
                 risk_factors.append({
                     "factor": "no_primary_source",
                     "severity": "high",
                     "description": "Skill not found in CV or GitHub (primary sources)"
                 })
             else:
-                risk_score += 15
+                risk_score += _W_NOT_IN_CV
                 risk_factors.append({
                     "factor": "not_in_cv",
                     "severity": "low",
@@ -95,8 +174,8 @@ class HallucinationDetectorService:
                 })
 
         # Factor 3: Vague/generic skill
-        if self._is_vague_skill(skill):
-            risk_score += 25
+        if self._is_vague_skill(skill_lower):
+            risk_score += _W_VAGUE_SKILL
             risk_factors.append({
                 "factor": "vague_skill",
                 "severity": "medium",
@@ -104,10 +183,10 @@ class HallucinationDetectorService:
             })
 
         # Factor 4: High-level skill with no evidence
-        if self._requires_evidence(skill):
+        if self._requires_evidence(skill_lower):
             has_evidence = self._check_evidence(evidence)
             if not has_evidence:
-                risk_score += 35
+                risk_score += _W_NO_EVIDENCE
                 risk_factors.append({
                     "factor": "no_evidence",
                     "severity": "high",
@@ -116,9 +195,11 @@ class HallucinationDetectorService:
 
         # Factor 5: Inconsistent with profile
         if profile_context:
-            is_inconsistent = self._check_profile_inconsistency(skill, profile_context)
+            if main_skills is None:
+                main_skills = self._profile_main_skills(profile_context)
+            is_inconsistent = self._check_profile_inconsistency(skill_lower, main_skills)
             if is_inconsistent:
-                risk_score += 20
+                risk_score += _W_PROFILE_INCONSISTENCY
                 risk_factors.append({
                     "factor": "profile_inconsistency",
                     "severity": "medium",
@@ -129,25 +210,30 @@ class HallucinationDetectorService:
         if evidence:
             last_activity = evidence.get("last_activity_date")
             if last_activity:
-                days_old = self._get_days_since_activity(last_activity)
+                days_old = self._get_days_since_activity(last_activity, now_ts)
                 if days_old > 365:  # More than 1 year
-                    risk_score += 15
+                    risk_score += _W_STALE_SKILL
                     risk_factors.append({
                         "factor": "stale_skill",
                         "severity": "low",
                         "description": f"No activity in {days_old} days (may be outdated)"
                     })
 
-        # Determine if it's likely a hallucination
+        # Determine if it's likely a hallucination, and the matching
+        # recommendation from the same thresholds
         if risk_score >= 60:
             is_hallucination = True
             risk_level = "high"
+            recommendation = _RECOMMEND_EXCLUDE
         elif risk_score >= 40:
             risk_level = "medium"
+            recommendation = _RECOMMEND_FLAG
         elif risk_score >= 20:
             risk_level = "low"
+            recommendation = _RECOMMEND_VERIFY
         else:
             risk_level = "minimal"
+            recommendation = _RECOMMEND_INCLUDE
 
         return {
             "skill": skill,
@@ -155,7 +241,7 @@ class HallucinationDetectorService:
             "risk_score": risk_score,
             "risk_level": risk_level,
             "risk_factors": risk_factors,
-            "recommendation": self._get_recommendation(risk_score, risk_level)
+            "recommendation": recommendation
         }
 
     def analyze_skill_list(
@@ -175,33 +261,44 @@ class HallucinationDetectorService:
         Returns:
             Analysis results for all skills
         """
-        results = []
-        hallucination_count = 0
-        high_risk_count = 0
-        medium_risk_count = 0
-
-        for skill, sources in skills_with_sources.items():
-            evidence = evidence_map.get(skill) if evidence_map else None
+        # One clock reading and one main-skills set for the whole list
+        now_ts = time.time()
+        main_skills = self._profile_main_skills(profile_context) if profile_context else None
 
-            analysis = self.analyze_skill(
+        results = [
+            self.analyze_skill(
                 skill=skill,
                 sources=sources,
-                evidence=evidence,
-                profile_context=profile_context
+                evidence=evidence_map.get(skill) if evidence_map else None,
+                profile_context=profile_context,
+                now_ts=now_ts,
+                main_skills=main_skills
             )
+            for skill, sources in skills_with_sources.items()
+        ]
+
+        # Sort by risk score (highest first)
+        results.sort(key=itemgetter("risk_score"), reverse=True)
 
-            results.append(analysis)
+        # Tally risk levels and collect skill names in one pass, in risk order
+        flagged_skills = []
+        suspicious_skills = []
+        high_risk_count = 0
+        medium_risk_count = 0
 
+        for analysis in results:
             if analysis["is_hallucination"]:
-                hallucination_count += 1
+                flagged_skills.append(analysis["skill"])
 
-            if analysis["risk_level"] == "high":
+            risk_level = analysis["risk_level"]
+            if risk_level == "high":
                 high_risk_count += 1
-            elif analysis["risk_level"] == "medium":
+                suspicious_skills.append(analysis["skill"])
+            elif risk_level == "medium":
                 medium_risk_count += 1
+                suspicious_skills.append(analysis["skill"])
 
-        # Sort by risk score (highest first)
-        results.sort(key=lambda x: x["risk_score"], reverse=True)
+        hallucination_count = len(flagged_skills)
 
         return {
             "total_skills": len(skills_with_sources),
@@ -210,18 +307,16 @@ class HallucinationDetectorService:
             "medium_risk_count": medium_risk_count,
             "hallucination_rate": round(hallucination_count / len(skills_with_sources) * 100, 2) if skills_with_sources else 0,
             "skill_analyses": results,
-            "flagged_skills": [r["skill"] for r in results if r["is_hallucination"]],
-            "suspicious_skills": [r["skill"] for r in results if r["risk_level"] in ["high", "medium"]]
+            "flagged_skills": flagged_skills,
+            "suspicious_skills": suspicious_skills
         }
 
-    def _is_vague_skill(self, skill: str) -> bool:
-        """Check if skill is vague/generic"""
-        skill_lower = skill.lower().strip()
+    def _is_vague_skill(self, skill_lower: str) -> bool:
+        """Check if skill (already lowercased and stripped) is vague/generic"""
         return skill_lower in self.VAGUE_SKILLS
 
-    def _requires_evidence(self, skill: str) -> bool:
-        """Check if skill requires concrete evidence"""
-        skill_lower = skill.lower().strip()
+    def _requires_evidence(self, skill_lower: str) -> bool:
+        """Check if skill (already lowercased and stripped) requires concrete evidence"""
         return skill_lower in self.REQUIRES_EVIDENCE
 
     def _check_evidence(self, evidence: Optional[Dict[str, any]]) -> bool:
@@ -237,78 +332,56 @@ class HallucinationDetectorService:
         if not evidence:
             return False
 
-        # Check for various types of evidence
-        has_repos = evidence.get("repository_count", 0) > 0
-        has_commits = evidence.get("commit_count", 0) > 0
-        has_articles = evidence.get("articles_written", 0) > 0
-        has_stackoverflow = evidence.get("stackoverflow_score", 0) > 0
+        # Any positive count is enough; stop at the first one
+        for key in _EVIDENCE_KEYS:
+            if evidence.get(key, 0) > 0:
+                return True
+
+        return False
 
-        return has_repos or has_commits or has_articles or has_stackoverflow
+    def _profile_main_skills(self, profile_context: Dict[str, any]) -> FrozenSet[str]:
+        """Lowercased main skills of a profile context (empty if none are listed)"""
+        if "main_skills" in profile_context:
+            return frozenset(s.lower() for s in profile_context["main_skills"])
+        return frozenset()
 
     def _check_profile_inconsistency(
         self,
-        skill: str,
-        profile_context: Dict[str, any]
+        skill_lower: str,
+        main_skills: FrozenSet[str]
     ) -> bool:
         """
-        Check if skill is inconsistent with overall profile.
+        Check if skill (already lowercased) is inconsistent with overall profile.
 
         For example:
         - Frontend skill in a backend-heavy profile
         - ML skill with no Python/R in profile
         - Mobile skill with no Swift/Kotlin
-        """
-        skill_lower = skill.lower()
-
-        # Get profile's main skills
-        main_skills = set()
-        if "main_skills" in profile_context:
-            main_skills = {s.lower() for s in profile_context["main_skills"]}
-
-        # ML/DS skills require Python/R
-        ml_keywords = ["machine learning", "deep learning", "tensorflow", "pytorch", "keras"]
-        if any(keyword in skill_lower for keyword in ml_keywords):
-            if not any(lang in main_skills for lang in ["python", "r", "julia"]):
-                return True
-
-        # Mobile skills require mobile languages
-        mobile_keywords = ["ios", "android", "mobile", "swift", "kotlin"]
-        if any(keyword in skill_lower for keyword in mobile_keywords):
-            if not any(lang in main_skills for lang in ["swift", "kotlin", "java", "react native", "flutter"]):
-                return True
 
-        # Blockchain skills require relevant languages
-        blockchain_keywords = ["blockchain", "solidity", "smart contract", "ethereum"]
-        if any(keyword in skill_lower for keyword in blockchain_keywords):
-            if not any(lang in main_skills for lang in ["solidity", "rust", "go", "javascript"]):
+        Args:
+            skill_lower: Lowercased skill name
+            main_skills: Profile's main skills, from _profile_main_skills
+        """
+        for keywords_re, required_languages in self.INCONSISTENCY_RULES:
+            if required_languages.isdisjoint(main_skills) and keywords_re.search(skill_lower):
                 return True
 
         return False
 
-    def _get_days_since_activity(self, last_activity: any) -> int:
+    def _get_days_since_activity(self, last_activity: any, now_ts: Optional[float] = None) -> int:
         """Calculate days since last activity"""
         if isinstance(last_activity, str):
-            try:
-                last_activity = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
-            except Exception:
+            activity_ts = _activity_timestamp(last_activity)
+            if activity_ts is None:
                 return 999  # Assume very old if can't parse
-
-        if isinstance(last_activity, datetime):
-            now = datetime.now(last_activity.tzinfo) if last_activity.tzinfo else datetime.now()
-            return (now - last_activity).days
-
-        return 999
-
-    def _get_recommendation(self, risk_score: int, risk_level: str) -> str:
-        """Get recommendation based on risk score"""
-        if risk_score >= 60:
-            return "EXCLUDE - Likely hallucination, exclude from profile"
-        elif risk_score >= 40:
-            return "FLAG - Requires manual review and verification"
-        elif risk_score >= 20:
-            return "VERIFY - Include but mark as unverified"
+        elif isinstance(last_activity, datetime):
+            activity_ts = last_activity.timestamp()
         else:
-            return "INCLUDE - Low risk, safe to include"
+            return 999
+
+        if now_ts is None:
+            now_ts = time.time()
+        return int((now_ts - activity_ts) // 86400)
 
     def filter_hallucinations(
         self,
@@ -364,9 +437,10 @@ class HallucinationDetectorService:
             report.append("")
 
         if analysis_results["suspicious_skills"]:
+            flagged = set(analysis_results["flagged_skills"])
             report.append("SUSPICIOUS SKILLS (REQUIRE VERIFICATION):")
             for skill in analysis_results["suspicious_skills"]:
-                if skill not in analysis_results["flagged_skills"]:
+                if skill not in flagged:
                     report.append(f"  - {skill}")
             report.append("")
 
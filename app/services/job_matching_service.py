@@ -8,41 +8,113 @@ Analyzes candidates against job descriptions and provides detailed matching anal
 - Overall assessment
 - Hiring recommendations
 """
-import json
+import asyncio
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI
+import orjson
 import logging
 from datetime import datetime
 
 from app.config import settings
+from app.services.openai_common import OpenAIServiceBase, squash_text
 
 logger = logging.getLogger(__name__)
 
 
-class JobMatchingService:
+# Fields returned for every analyzed candidate. Type hints instead of example
+# values keep the prompt short
+_MATCH_ANALYSIS_SCHEMA = """{
+  "match_score": <int 0-100, overall fit>,
+  "recommendation": "Highly Recommended"|"Recommended"|"Maybe"|"Not Recommended",
+  "key_strengths": [<str>],
+  "relevant_experience": [<str>],
+  "potential_concerns": [<str>],
+  "skill_gaps": [<missing skill>],
+  "cultural_fit_indicators": [<str>],
+  "overall_assessment": <2-3 sentences on why the candidate is/isn't a good fit>,
+  "interview_focus_areas": [<str>],
+  "compensation_expectations": <estimated range or "Not specified">,
+  "availability_concerns": <red flags about availability or commitment>
+}"""
+
+_MATCH_GUIDANCE = """Be honest and balanced: cover strengths and weaknesses.
+Consider technical skills, experience level, cultural fit, and growth potential."""
+
+# Single-candidate analysis
+_MATCH_SYSTEM_PROMPT = f"""You are an expert technical recruiter and hiring manager analyzing candidate fit for a specific role.
+
+Analyze the candidate's profile against the job description and provide a detailed assessment.
+
+Return a JSON object with:
+{_MATCH_ANALYSIS_SCHEMA}
+
+{_MATCH_GUIDANCE}"""
+
+_MATCH_SYSTEM_MESSAGE = {"role": "system", "content": _MATCH_SYSTEM_PROMPT}
+
+# Several candidates analyzed independently in one request
+_BATCH_MATCH_SYSTEM_PROMPT = f"""You are an expert technical recruiter and hiring manager analyzing candidate fit for a specific role.
+
+You will be given several candidate profiles, each under a "--- CANDIDATE <id> ---" header.
+Analyze each candidate's profile against the job description independently and provide a detailed assessment.
+
+Return a JSON object {{"results": [...]}} with one entry per candidate. Each entry has
+"candidate_id" (the <id> from that candidate's header) plus:
+{_MATCH_ANALYSIS_SCHEMA}
+
+{_MATCH_GUIDANCE}"""
+
+_BATCH_MATCH_SYSTEM_MESSAGE = {"role": "system", "content": _BATCH_MATCH_SYSTEM_PROMPT}
+
+
+class JobMatchingService(OpenAIServiceBase):
     """AI-powered job matching service using GPT-4o"""
 
+    # Candidates packed into one request, so the system prompt and job
+    # description are sent once per group instead of once per candidate
+    CANDIDATES_PER_REQUEST = 5
+    BATCH_TOKENS_PER_CANDIDATE = 1000
+
+    # Output budget for one candidate. A complete analysis fits well within
+    # MATCH_MAX_TOKENS; a response cut off there is re-run once with the larger cap
+    MATCH_MAX_TOKENS = 800
+    MATCH_RETRY_MAX_TOKENS = 2500
+
+    # Mixed into every cache key; bump when prompts or the model change so
+    # stale analyses are not served
+    CACHE_VERSION = "gpt-4o:1"
+    CACHE_MAX_ENTRIES = 2048
+
     def __init__(self):
         """Initialize OpenAI client"""
+        super().__init__()
+
         if not settings.OPENAI_API_KEY:
             logger.warning("OpenAI API key not configured")
             self.client = None
         else:
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            # Retries are handled by _call_gpt, not stacked on top of the SDK's own
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
 
     async def match_candidates_to_job(
         self,
         job_description: str,
         candidates: List[Dict[str, Any]],
-        top_n: Optional[int] = None
+        top_n: Optional[int] = None,
+        prefilter_multiplier: int = 3
     ) -> Dict[str, Any]:
         """
         Match candidates to a job description using AI analysis
 
+        When top_n is set, candidates are first ranked by the rule-based
+        fallback score and only the best top_n * prefilter_multiplier are
+        sent to GPT-4o.
+
         Args:
             job_description: The job description text
             candidates: List of candidate profiles from CandidateAggregationService
             top_n: Optional limit on number of candidates to return
+            prefilter_multiplier: Shortlist size as a multiple of top_n
 
         Returns:
             Dict containing:
@@ -68,10 +140,48 @@ class JobMatchingService:
         logger.info(f"Matching {len(candidates)} candidates to job description")
 
         try:
-            # Analyze each candidate
+            # Shortlist by the cheap rule-based score so GPT only sees the
+            # candidates that can plausibly make the top_n
+            shortlist = candidates
+            passed_over: List[Dict[str, Any]] = []
+            if top_n and len(candidates) > top_n * prefilter_multiplier:
+                ranked = sorted(
+                    candidates,
+                    key=lambda c: self._fallback_candidate_analysis(c)["match_score"],
+                    reverse=True
+                )
+                cutoff = top_n * prefilter_multiplier
+                shortlist, passed_over = ranked[:cutoff], ranked[cutoff:]
+                logger.info(f"Prefiltered to {len(shortlist)} candidates for AI analysis")
+
+            # Candidates already analyzed against this job description are
+            # served from the cache; only the rest go to GPT
+            contexts = [self._prepare_candidate_context(candidate) for candidate in shortlist]
+            analyses = [
+                self._cache_get(self._cache_key(job_description, context))
+                for context in contexts
+            ]
+            pending = [i for i, analysis in enumerate(analyses) if analysis is None]
+
+            # Analyze candidate groups concurrently (bounded by the semaphore)
+            groups = [
+                pending[i:i + self.CANDIDATES_PER_REQUEST]
+                for i in range(0, len(pending), self.CANDIDATES_PER_REQUEST)
+            ]
+            grouped_analyses = await asyncio.gather(*(
+                self._analyze_candidate_batch(
+                    job_description,
+                    [shortlist[i] for i in group],
+                    [contexts[i] for i in group]
+                )
+                for group in groups
+            ))
+            for group, group_analyses in zip(groups, grouped_analyses):
+                for i, analysis in zip(group, group_analyses):
+                    analyses[i] = analysis
+
             matches = []
-            for candidate in candidates:
-                analysis = await self._analyze_candidate_match(job_description, candidate)
+            for candidate, analysis in zip(shortlist, analyses):
                 if analysis:
                     matches.append({
                         "candidate": self._format_candidate_summary(candidate),
@@ -81,8 +191,14 @@ class JobMatchingService:
             # Sort by match score (highest first)
             matches.sort(key=lambda x: x["analysis"]["match_score"], reverse=True)
 
-            # Limit results if requested
+            # Limit results if requested, topping up with rule-based analyses
+            # of passed-over candidates if AI analysis came back short
             if top_n:
+                for candidate in passed_over[:max(top_n - len(matches), 0)]:
+                    matches.append({
+                        "candidate": self._format_candidate_summary(candidate),
+                        "analysis": self._fallback_candidate_analysis(candidate)
+                    })
                 matches = matches[:top_n]
 
             return {
@@ -97,53 +213,44 @@ class JobMatchingService:
             logger.error(f"Error matching candidates: {e}")
             return self._fallback_matching(job_description, candidates, top_n)
 
-    async def _analyze_candidate_match(
+    async def _analyze_candidate_batch(
         self,
         job_description: str,
-        candidate: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+        candidates: List[Dict[str, Any]],
+        contexts: Optional[List[str]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
         """
-        Analyze a single candidate against the job description
+        Analyze several candidates against the job description in one request
+
+        Candidates missing from the response, or all of them if the request
+        fails, are retried with one _analyze_candidate_match call each.
 
         Args:
             job_description: Job description text
-            candidate: Candidate profile data
+            candidates: Candidate profiles to analyze together
+            contexts: Prepared context for each candidate, if already built
 
         Returns:
-            Dict with match analysis or None if analysis fails
+            List of match analyses, in the same order as candidates
         """
+        if contexts is None:
+            contexts = [self._prepare_candidate_context(candidate) for candidate in candidates]
+
+        if len(candidates) == 1:
+            return [await self._analyze_candidate_match(job_description, candidates[0], contexts[0])]
+
+        results: Dict[str, Dict[str, Any]] = {}
         try:
-            # Prepare candidate context
-            candidate_context = self._prepare_candidate_context(candidate)
+            # Candidates are identified by their position in this group
+            candidate_profiles = "\n\n".join(
+                f"--- CANDIDATE {i} ---\n{context}"
+                for i, context in enumerate(contexts, 1)
+            )
 
-            # Call GPT-4o for analysis
-            response = self.client.chat.completions.create(
+            response = await self._call_gpt(
                 model="gpt-4o",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an expert technical recruiter and hiring manager analyzing candidate fit for a specific role.
-
-Analyze the candidate's profile against the job description and provide a detailed assessment.
-
-Return a JSON object with:
-{
-  "match_score": 0-100 (integer score indicating overall fit),
-  "recommendation": "Highly Recommended" | "Recommended" | "Maybe" | "Not Recommended",
-  "key_strengths": ["strength1", "strength2", "strength3"],
-  "relevant_experience": ["experience1", "experience2"],
-  "potential_concerns": ["concern1", "concern2"],
-  "skill_gaps": ["missing_skill1", "missing_skill2"],
-  "cultural_fit_indicators": ["indicator1", "indicator2"],
-  "overall_assessment": "2-3 sentences summarizing why this candidate is/isn't a good fit",
-  "interview_focus_areas": ["area1", "area2", "area3"],
-  "compensation_expectations": "Estimated range or 'Not specified'",
-  "availability_concerns": "Any red flags about availability or commitment"
-}
-
-Be honest and balanced in your assessment. Highlight both strengths and weaknesses.
-Consider technical skills, experience level, cultural fit, and growth potential."""
-                    },
+                    _BATCH_MATCH_SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": f"""Job Description:
@@ -151,19 +258,101 @@ Consider technical skills, experience level, cultural fit, and growth potential.
 
 ---
 
-Candidate Profile:
-{candidate_context}
+Candidate Profiles:
+{candidate_profiles}
 
-Please analyze this candidate's fit for the role."""
+Please analyze each candidate's fit for the role."""
                     }
                 ],
                 response_format={"type": "json_object"},
                 temperature=0.3,
-                max_tokens=2500
+                max_tokens=self.BATCH_TOKENS_PER_CANDIDATE * len(candidates)
             )
 
-            result = json.loads(response.choices[0].message.content)
+            for entry in orjson.loads(response.choices[0].message.content).get("results", []):
+                if isinstance(entry, dict) and "match_score" in entry:
+                    results[str(entry.pop("candidate_id", ""))] = entry
+
+            logger.info(f"Analyzed {len(results)}/{len(candidates)} candidates in one request")
+
+        except Exception as e:
+            logger.error(f"Error analyzing candidate batch: {e}")
+
+        analyses = [results.get(str(i)) for i in range(1, len(candidates) + 1)]
+        for context, analysis in zip(contexts, analyses):
+            if analysis is not None:
+                self._cache_put(self._cache_key(job_description, context), analysis)
+
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if missing:
+            retried = await asyncio.gather(*(
+                self._analyze_candidate_match(job_description, candidates[i], contexts[i])
+                for i in missing
+            ))
+            for i, analysis in zip(missing, retried):
+                analyses[i] = analysis
+
+        return analyses
+
+    async def _analyze_candidate_match(
+        self,
+        job_description: str,
+        candidate: Dict[str, Any],
+        candidate_context: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a single candidate against the job description
+
+        Args:
+            job_description: Job description text
+            candidate: Candidate profile data
+            candidate_context: Prepared candidate context, if already built
+
+        Returns:
+            Dict with match analysis or None if analysis fails
+        """
+        try:
+            # Prepare candidate context
+            if candidate_context is None:
+                candidate_context = self._prepare_candidate_context(candidate)
+
+            cache_key = self._cache_key(job_description, candidate_context)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            messages = [
+                _MATCH_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": f"""Job Description:
+{job_description}
+
+---
+
+Candidate Profile:
+{candidate_context}
+
+Please analyze this candidate's fit for the role."""
+                }
+            ]
+
+            # Call GPT-4o for analysis
+            for max_tokens in (self.MATCH_MAX_TOKENS, self.MATCH_RETRY_MAX_TOKENS):
+                response = await self._call_gpt(
+                    model="gpt-4o",
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.3,
+                    max_tokens=max_tokens
+                )
+                if response.choices[0].finish_reason != "length":
+                    break
+                logger.warning(f"Candidate analysis hit max_tokens={max_tokens}")
+
+            result = orjson.loads(response.choices[0].message.content)
             logger.info(f"Successfully analyzed candidate match (Score: {result.get('match_score')})")
+            self._cache_put(cache_key, result)
             return result
 
         except Exception as e:
@@ -174,6 +363,9 @@ Please analyze this candidate's fit for the role."""
         """
         Prepare candidate data as formatted context for GPT-4o
 
+        Uses terse section tags and one line per field, with whitespace-collapsed
+        free text, since input tokens drive the cost and latency of each call.
+
         Args:
             candidate: Candidate profile dict
 
@@ -182,117 +374,110 @@ Please analyze this candidate's fit for the role."""
         """
         context_parts = []
 
-        # Personal Information
+        # Personal Information (contact details don't bear on fit)
         personal_info = candidate.get("personal_info", {})
+        identity = []
         if personal_info.get("name"):
-            context_parts.append(f"Name: {personal_info['name']}")
+            identity.append(f"name={personal_info['name']}")
         if personal_info.get("location"):
-            context_parts.append(f"Location: {personal_info['location']}")
-        if personal_info.get("email"):
-            context_parts.append(f"Email: {personal_info['email']}")
+            identity.append(f"location={personal_info['location']}")
+        if identity:
+            context_parts.append(f"[Candidate] {' '.join(identity)}")
 
-        # Professional Summary (AI-generated)
+        # Professional and skills summaries (AI-generated)
         if candidate.get("professional_summary"):
-            context_parts.append(f"\nProfessional Summary:\n{candidate['professional_summary']}")
-
-        # Skills Summary (AI-generated)
+            context_parts.append(f"summary: {squash_text(candidate['professional_summary'])}")
         if candidate.get("skills_summary"):
-            context_parts.append(f"\nSkills Summary:\n{candidate['skills_summary']}")
+            context_parts.append(f"skills_summary: {squash_text(candidate['skills_summary'])}")
 
         # Detailed Skills
         skills = candidate.get("skills", {})
         if skills:
-            context_parts.append("\nTechnical Skills:")
+            context_parts.append("[Skills]")
 
             if skills.get("technical_skills"):
-                context_parts.append("\nCore Technical Skills:")
-                for skill in skills["technical_skills"][:10]:  # Limit to top 10
-                    if isinstance(skill, dict):
-                        name = skill.get("name", "")
-                        proficiency = skill.get("proficiency", "")
-                        context_parts.append(f"  - {name} ({proficiency})")
-                    else:
-                        context_parts.append(f"  - {skill}")
+                technical = ", ".join(
+                    f"{skill.get('name', '')} ({skill.get('proficiency', '')})"
+                    if isinstance(skill, dict) else str(skill)
+                    for skill in skills["technical_skills"][:10]  # Limit to top 10
+                )
+                context_parts.append(f"technical: {technical}")
 
             if skills.get("languages"):
-                context_parts.append("\nProgramming Languages:")
-                for lang in skills["languages"][:10]:
-                    if isinstance(lang, dict):
-                        name = lang.get("name", "")
-                        proficiency = lang.get("proficiency", "")
-                        projects = lang.get("projects_count", 0)
-                        context_parts.append(f"  - {name} ({proficiency}, {projects} projects)")
-                    else:
-                        context_parts.append(f"  - {lang}")
+                languages = ", ".join(
+                    f"{lang.get('name', '')} ({lang.get('proficiency', '')}, {lang.get('projects_count', 0)} projects)"
+                    if isinstance(lang, dict) else str(lang)
+                    for lang in skills["languages"][:10]
+                )
+                context_parts.append(f"languages: {languages}")
 
             if skills.get("frameworks"):
-                context_parts.append("\nFrameworks:")
-                for fw in skills["frameworks"][:10]:
-                    if isinstance(fw, dict):
-                        context_parts.append(f"  - {fw.get('name', '')}")
-                    else:
-                        context_parts.append(f"  - {fw}")
+                frameworks = ", ".join(
+                    fw.get("name", "") if isinstance(fw, dict) else str(fw)
+                    for fw in skills["frameworks"][:10]
+                )
+                context_parts.append(f"frameworks: {frameworks}")
 
             if skills.get("tools"):
-                tools_str = ", ".join(skills["tools"][:15])
-                context_parts.append(f"\nTools: {tools_str}")
+                context_parts.append(f"tools: {', '.join(skills['tools'][:15])}")
 
             if skills.get("domains"):
-                domains_str = ", ".join(skills["domains"][:10])
-                context_parts.append(f"\nDomain Expertise: {domains_str}")
+                context_parts.append(f"domains: {', '.join(skills['domains'][:10])}")
 
         # Work History
         work_history = candidate.get("work_history", [])
         if work_history:
-            context_parts.append("\nWork Experience:")
+            context_parts.append("[Experience]")
             for i, job in enumerate(work_history[:5]):  # Limit to 5 most recent
                 company = job.get("company", "Unknown Company")
                 title = job.get("title", "Unknown Position")
                 dates = f"{job.get('start_date', '')} - {job.get('end_date', 'Present')}"
-                context_parts.append(f"\n{i+1}. {title} at {company} ({dates})")
+                entry = f"{i+1}. {title} @ {company} ({dates})"
                 if job.get("description"):
                     # Truncate long descriptions
-                    desc = job["description"][:200] + "..." if len(job["description"]) > 200 else job["description"]
-                    context_parts.append(f"   {desc}")
+                    entry += f": {squash_text(job['description'], 200)}"
+                context_parts.append(entry)
 
         # Education
         education = candidate.get("education", [])
         if education:
-            context_parts.append("\nEducation:")
+            context_parts.append("[Education]")
             for edu in education[:3]:
                 institution = edu.get("institution", "Unknown")
                 degree = edu.get("degree", "Unknown")
                 field = edu.get("field_of_study", "")
-                context_parts.append(f"  - {degree} {field} from {institution}".strip())
+                context_parts.append(f"- {degree} {field} @ {institution}".replace("  ", " "))
 
         # GitHub Metrics
         github = candidate.get("github_metrics", {})
         if github:
-            context_parts.append("\nGitHub Activity:")
+            metrics = []
             if github.get("username"):
-                context_parts.append(f"  Username: {github['username']}")
+                metrics.append(f"user={github['username']}")
             if github.get("activity_level"):
-                context_parts.append(f"  Activity Level: {github['activity_level']}")
+                metrics.append(f"activity={github['activity_level']}")
             if github.get("commit_quality_score"):
-                context_parts.append(f"  Code Quality Score: {github['commit_quality_score']}/100")
+                metrics.append(f"code_quality={github['commit_quality_score']}/100")
             if github.get("collaboration_score"):
-                context_parts.append(f"  Collaboration Score: {github['collaboration_score']}/100")
+                metrics.append(f"collaboration={github['collaboration_score']}/100")
             if github.get("public_repos"):
-                context_parts.append(f"  Public Repositories: {github['public_repos']}")
+                metrics.append(f"repos={github['public_repos']}")
             if github.get("followers"):
-                context_parts.append(f"  Followers: {github['followers']}")
+                metrics.append(f"followers={github['followers']}")
+            context_parts.append(f"[GitHub] {' '.join(metrics)}".rstrip())
 
         # Stack Overflow
         stackoverflow = candidate.get("stackoverflow_expertise")
         if stackoverflow:
-            context_parts.append("\nStack Overflow:")
-            context_parts.append(f"  Reputation: {stackoverflow.get('reputation', 0)}")
+            metrics = [f"reputation={stackoverflow.get('reputation', 0)}"]
             if stackoverflow.get('badges'):
                 badges = stackoverflow['badges']
-                context_parts.append(f"  Badges: {badges.get('gold', 0)} gold, {badges.get('silver', 0)} silver, {badges.get('bronze', 0)} bronze")
+                metrics.append(
+                    f"badges={badges.get('gold', 0)}g/{badges.get('silver', 0)}s/{badges.get('bronze', 0)}b"
+                )
+            context_parts.append(f"[StackOverflow] {' '.join(metrics)}")
             if stackoverflow.get('expertise_areas'):
-                areas = ", ".join(stackoverflow['expertise_areas'][:5])
-                context_parts.append(f"  Expertise: {areas}")
+                context_parts.append(f"expertise: {', '.join(stackoverflow['expertise_areas'][:5])}")
 
         # Web Presence
         web_presence = candidate.get("web_presence", {})
@@ -302,24 +487,20 @@ Please analyze this candidate's fit for the role."""
             talks = len(web_presence.get("talks", []))
 
             if total_mentions > 0 or articles > 0 or talks > 0:
-                context_parts.append("\nOnline Presence:")
-                if articles > 0:
-                    context_parts.append(f"  - Published {articles} articles/blog posts")
-                if talks > 0:
-                    context_parts.append(f"  - Given {talks} conference talks/presentations")
-                if total_mentions > 0:
-                    context_parts.append(f"  - {total_mentions} total web mentions")
+                context_parts.append(
+                    f"[Web] articles={articles} talks={talks} mentions={total_mentions}"
+                )
 
         # Strengths and Growth Areas
         if candidate.get("strengths"):
-            context_parts.append(f"\nKey Strengths: {', '.join(candidate['strengths'][:5])}")
+            context_parts.append(f"strengths: {', '.join(candidate['strengths'][:5])}")
 
         if candidate.get("areas_for_growth"):
-            context_parts.append(f"\nAreas for Growth: {', '.join(candidate['areas_for_growth'][:3])}")
+            context_parts.append(f"growth_areas: {', '.join(candidate['areas_for_growth'][:3])}")
 
         # Recommended Roles
         if candidate.get("recommended_roles"):
-            context_parts.append(f"\nRecommended Roles: {', '.join(candidate['recommended_roles'][:5])}")
+            context_parts.append(f"recommended_roles: {', '.join(candidate['recommended_roles'][:5])}")
 
         return "\n".join(context_parts)
 
@@ -439,3 +620,22 @@ Please analyze this candidate's fit for the role."""
             "compensation_expectations": "Not specified",
             "availability_concerns": "None identified"
         }
+
+
+# Singleton instance
+_job_matching_service = None
+
+def get_job_matching_service() -> JobMatchingService:
+    """Get or create the job matching service singleton"""
+    global _job_matching_service
+    if _job_matching_service is None:
+        _job_matching_service = JobMatchingService()
+    return _job_matching_service
+
+
+async def close_job_matching_service() -> None:
+    """Close the job matching service singleton's connections, if it was created"""
+    global _job_matching_service
+    if _job_matching_service is not None:
+        await _job_matching_service.aclose()
+        _job_matching_service = None
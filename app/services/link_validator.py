@@ -2,25 +2,152 @@
 Link Validation Service
 Validates URLs and checks if they are accessible
 """
+import asyncio
+import ipaddress
 import re
-import requests
-from typing import Tuple, Optional, Dict
-from urllib.parse import urlparse
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Tuple, Optional, Dict, List
+from urllib.parse import urlsplit
 import httpx
+import orjson
 
 from app.config import settings
 
+# Strict URL pattern, kept for is_valid_url(strict=True)
+_URL_RE = re.compile(
+    r'^(?:http|https)://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# DNS host name (already lowercased by urlsplit): LDH labels, alphabetic or
+# punycode TLD, optional trailing dot
+_HOSTNAME_RE = re.compile(
+    r'^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+'
+    r'(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})\.?$'
+)
+
+# GitHub profile URL, scheme optional, on github.com or a subdomain. The first
+# path segment is the username: alphanumeric and hyphens, max 39 chars
+_GITHUB_PROFILE_RE = re.compile(
+    r'^(?:https?://)?(?:[a-z0-9-]+\.)*github\.com(?::\d+)?/+'
+    r'([a-z0-9][-a-z0-9]{0,38})(?:[/?#]|$)',
+    re.IGNORECASE
+)
+
+# Expected domains per social platform (None = any domain)
+_PLATFORM_DOMAINS = {
+    'github': ('github.com',),
+    'linkedin': ('linkedin.com',),
+    'twitter': ('twitter.com', 'x.com'),
+    'portfolio': None
+}
+
+
+@lru_cache(maxsize=8192)
+def _hostname(url: str) -> str:
+    """Lowercased host of a URL, or '' if it has none"""
+    try:
+        return urlsplit(url).hostname or ''
+    except ValueError:
+        return ''
+
+
+def _matches_domain(host: str, domain: str) -> bool:
+    """True if host is domain itself or one of its subdomains"""
+    return host == domain or host.endswith('.' + domain)
+
+
+# Pooled clients shared by all accessibility checks and GitHub API lookups
+# (created on first use)
+_http_client: Optional[httpx.AsyncClient] = None
+_github_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client used for link checks"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    return _http_client
+
+
+def _get_github_client() -> httpx.AsyncClient:
+    """Get or create the shared, authenticated GitHub API client"""
+    global _github_client
+    if _github_client is None:
+        _github_client = httpx.AsyncClient(
+            base_url='https://api.github.com',
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={
+                'Authorization': f'token {settings.GITHUB_TOKEN}',
+                'Accept': 'application/vnd.github.v3+json'
+            }
+        )
+    return _github_client
+
+
+# GitHub account lookups (found / not found) as (stored_at, JSON bytes), keyed
+# by lowercased username (LRU order)
+_GITHUB_USER_CACHE_TTL = 3600
+_GITHUB_USER_CACHE_MAX_ENTRIES = 10000
+_github_user_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+
+def _github_user_cache_get(username: str) -> Optional[Dict]:
+    """Return a fresh copy of a cached account lookup, or None if missing or expired"""
+    key = username.lower()
+    entry = _github_user_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, data = entry
+    if time.monotonic() - stored_at >= _GITHUB_USER_CACHE_TTL:
+        del _github_user_cache[key]
+        return None
+    _github_user_cache.move_to_end(key)
+    return orjson.loads(data)
+
+
+def _github_user_cache_put(username: str, lookup: Dict) -> None:
+    """Store an account lookup, evicting the least recently used entry when full"""
+    key = username.lower()
+    _github_user_cache[key] = (time.monotonic(), orjson.dumps(lookup))
+    _github_user_cache.move_to_end(key)
+    if len(_github_user_cache) > _GITHUB_USER_CACHE_MAX_ENTRIES:
+        _github_user_cache.popitem(last=False)
+
+
+async def close_link_validator() -> None:
+    """Close the shared link-check and GitHub API clients, if they were created"""
+    global _http_client, _github_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _github_client is not None:
+        await _github_client.aclose()
+        _github_client = None
+
 
 class LinkValidator:
     """Validate and verify URLs"""
 
     @staticmethod
-    def is_valid_url(url: str) -> bool:
+    def is_valid_url(url: str, strict: bool = False) -> bool:
         """
         Check if URL has valid format
 
         Args:
             url: URL string to validate
+            strict: Match against the legacy regex (TLDs of 2-6 letters only)
 
         Returns:
             bool: True if URL is valid format
@@ -28,19 +155,34 @@ class LinkValidator:
         if not url:
             return False
 
-        # Basic URL pattern
-        url_pattern = re.compile(
-            r'^(?:http|https)://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+        if strict:
+            return bool(_URL_RE.match(url))
+
+        # No whitespace or control characters anywhere in the URL
+        if not url.isprintable() or ' ' in url:
+            return False
 
-        return bool(url_pattern.match(url))
+        try:
+            parts = urlsplit(url)
+            host = parts.hostname
+            _ = parts.port  # Raises ValueError on a malformed or out-of-range port
+        except ValueError:
+            return False
+
+        if parts.scheme not in ('http', 'https') or not host:
+            return False
+
+        if host == 'localhost' or _HOSTNAME_RE.match(host):
+            return True
+
+        try:
+            ipaddress.ip_address(host)
+            return True
+        except ValueError:
+            return False
 
     @staticmethod
-    def is_accessible(url: str, timeout: int = 5) -> bool:
+    async def is_accessible(url: str, timeout: int = 5) -> bool:
         """
         Check if URL is accessible (returns 200-399 status code)
 
@@ -51,16 +193,33 @@ class LinkValidator:
         Returns:
             bool: True if URL is accessible
         """
+        client = _get_http_client()
         try:
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
+            response = await client.head(url, timeout=timeout)
+            if response.status_code in (405, 501):
+                # Server doesn't support HEAD; GET without reading the body
+                async with client.stream('GET', url, timeout=timeout) as response:
+                    pass
             return 200 <= response.status_code < 400
-        except:
-            # If HEAD fails, try GET
-            try:
-                response = requests.get(url, timeout=timeout, allow_redirects=True)
-                return 200 <= response.status_code < 400
-            except:
-                return False
+        except (httpx.HTTPError, httpx.InvalidURL):
+            # Unreachable hosts and timeouts would fail a GET the same way
+            return False
+
+    @staticmethod
+    async def validate_batch(urls: List[str], timeout: int = 5) -> List[bool]:
+        """
+        Check accessibility of several URLs concurrently
+
+        Args:
+            urls: URLs to check
+            timeout: Per-request timeout in seconds
+
+        Returns:
+            List[bool]: Accessibility of each URL, in input order
+        """
+        return list(await asyncio.gather(
+            *(LinkValidator.is_accessible(url, timeout) for url in urls)
+        ))
 
     @staticmethod
     def verify_domain(url: str, expected_domain: str) -> bool:
@@ -72,13 +231,9 @@ class LinkValidator:
             expected_domain: Expected domain (e.g., 'github.com')
 
         Returns:
-            bool: True if URL is from expected domain
+            bool: True if URL is from expected domain or one of its subdomains
         """
-        try:
-            parsed = urlparse(url)
-            return expected_domain.lower() in parsed.netloc.lower()
-        except:
-            return False
+        return _matches_domain(_hostname(url), expected_domain.lower())
 
     @staticmethod
     def validate_social_link(url: str, platform: str) -> Tuple[bool, bool, bool]:
@@ -95,24 +250,14 @@ class LinkValidator:
         is_valid_format = LinkValidator.is_valid_url(url)
 
         # Check domain based on platform
-        domain_map = {
-            'github': 'github.com',
-            'linkedin': 'linkedin.com',
-            'twitter': ['twitter.com', 'x.com'],
-            'portfolio': None  # Any domain is fine
-        }
-
-        expected_domains = domain_map.get(platform)
+        expected_domains = _PLATFORM_DOMAINS.get(platform)
         is_correct_domain = True
 
         if expected_domains:
-            if isinstance(expected_domains, list):
-                is_correct_domain = any(
-                    LinkValidator.verify_domain(url, domain)
-                    for domain in expected_domains
-                )
-            else:
-                is_correct_domain = LinkValidator.verify_domain(url, expected_domains)
+            host = _hostname(url)
+            is_correct_domain = any(
+                _matches_domain(host, domain) for domain in expected_domains
+            )
 
         # Check accessibility (optional, can be slow)
         # is_accessible = LinkValidator.is_accessible(url)
@@ -134,37 +279,8 @@ class LinkValidator:
         if not url:
             return None
 
-        # Add https:// if not present
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-
-        # Parse URL
-        try:
-            parsed = urlparse(url)
-
-            # Check if it's a GitHub URL
-            if 'github.com' not in parsed.netloc.lower():
-                return None
-
-            # Extract path parts
-            path_parts = [p for p in parsed.path.split('/') if p]
-
-            if not path_parts:
-                return None
-
-            # First part should be the username
-            username = path_parts[0]
-
-            # Validate username format (GitHub usernames: alphanumeric and hyphens, max 39 chars)
-            username_pattern = re.compile(r'^[a-zA-Z0-9][-a-zA-Z0-9]{0,38}$')
-
-            if username_pattern.match(username):
-                return username
-
-            return None
-
-        except Exception:
-            return None
+        match = _GITHUB_PROFILE_RE.match(url)
+        return match.group(1) if match else None
 
     @staticmethod
     async def validate_github_url(url: str) -> Dict[str, any]:
@@ -206,38 +322,42 @@ class LinkValidator:
             result['account_exists'] = None  # Unknown
             return result
 
+        # Accounts seen within the last hour don't spend API rate limit
+        cached = _github_user_cache_get(username)
+        if cached is not None:
+            result.update(cached)
+            return result
+
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    'Authorization': f'token {settings.GITHUB_TOKEN}',
-                    'Accept': 'application/vnd.github.v3+json'
+            response = await _get_github_client().get(f'/users/{username}')
+
+            if response.status_code == 200:
+                data = response.json()
+                result['account_exists'] = True
+                result['profile_data'] = {
+                    'username': data.get('login'),
+                    'name': data.get('name'),
+                    'bio': data.get('bio'),
+                    'public_repos': data.get('public_repos'),
+                    'followers': data.get('followers')
                 }
+            elif response.status_code == 404:
+                result['account_exists'] = False
+                result['error_message'] = f'GitHub account @{username} not found'
+            elif response.status_code == 403:
+                result['account_exists'] = None
+                result['error_message'] = 'GitHub API rate limit exceeded'
+            else:
+                result['account_exists'] = None
+                result['error_message'] = f'GitHub API error: {response.status_code}'
 
-                response = await client.get(
-                    f'https://api.github.com/users/{username}',
-                    headers=headers,
-                    timeout=5.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    result['account_exists'] = True
-                    result['profile_data'] = {
-                        'username': data.get('login'),
-                        'name': data.get('name'),
-                        'bio': data.get('bio'),
-                        'public_repos': data.get('public_repos'),
-                        'followers': data.get('followers')
-                    }
-                elif response.status_code == 404:
-                    result['account_exists'] = False
-                    result['error_message'] = f'GitHub account @{username} not found'
-                elif response.status_code == 403:
-                    result['account_exists'] = None
-                    result['error_message'] = 'GitHub API rate limit exceeded'
-                else:
-                    result['account_exists'] = None
-                    result['error_message'] = f'GitHub API error: {response.status_code}'
+            # Only definite answers are cached; rate limits and errors are retried
+            if result['account_exists'] is not None:
+                _github_user_cache_put(username, {
+                    'account_exists': result['account_exists'],
+                    'error_message': result['error_message'],
+                    'profile_data': result['profile_data']
+                })
 
         except httpx.TimeoutException:
             result['account_exists'] = None
@@ -248,6 +368,26 @@ class LinkValidator:
 
         return result
 
+    @staticmethod
+    async def validate_github_urls(urls: List[str], max_concurrency: int = 20) -> List[Dict[str, any]]:
+        """
+        Validate several GitHub URLs concurrently
+
+        Args:
+            urls: GitHub URLs to validate
+            max_concurrency: Maximum GitHub API requests in flight at once
+
+        Returns:
+            List of validate_github_url results, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def validate(url: str) -> Dict[str, any]:
+            async with semaphore:
+                return await LinkValidator.validate_github_url(url)
+
+        return list(await asyncio.gather(*(validate(url) for url in urls)))
+
     @staticmethod
     def validate_github_url_sync(url: str) -> Dict[str, any]:
         """
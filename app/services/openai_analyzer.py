@@ -2,9 +2,10 @@
 OpenAI GPT-4o Service for Skill Extraction and Analysis
 Uses GPT-4o to analyze GitHub data and extract structured skills
 """
+import asyncio
 import json
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI
 import logging
 from datetime import datetime
 
@@ -22,7 +23,12 @@ class OpenAIAnalyzer:
             logger.warning("OpenAI API key not configured")
             self.client = None
         else:
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections used for OpenAI requests"""
+        if self.client:
+            await self.client.close()
 
     async def analyze_developer_activity(self, github_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -48,7 +54,7 @@ class OpenAIAnalyzer:
         try:
             context = self._prepare_activity_context(github_data)
 
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
                     {
@@ -197,7 +203,7 @@ Base your analysis on:
                 context += f"\n\n=== RESUME/CV CONTENT ===\n{resume_content}\n"
 
             # Call GPT-4o
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
                     {
@@ -388,7 +394,7 @@ Prioritize skills that appear in BOTH GitHub and Resume for higher confidence.""
                 if cv_data.get('education'):
                     context += f"Education: {json.dumps(cv_data['education'], indent=2)}\n"
 
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
                     {
@@ -423,12 +429,11 @@ Prioritize skills that appear in BOTH GitHub and Resume for higher confidence.""
         """
         logger.info("Starting comprehensive GitHub analysis" + (" with resume content" if resume_content else ""))
 
-        # Run both analyses in parallel for efficiency
-        skills_task = self.extract_skills_from_github(github_data, resume_content)
-        activity_task = self.analyze_developer_activity(github_data)
-
-        skills_result = await skills_task
-        activity_result = await activity_task
+        # Run both analyses in parallel for efficiency (each falls back on its own errors)
+        skills_result, activity_result = await asyncio.gather(
+            self.extract_skills_from_github(github_data, resume_content),
+            self.analyze_developer_activity(github_data)
+        )
 
         return {
             "skills_analysis": skills_result,
@@ -0,0 +1,305 @@
+"""
+Shared OpenAI plumbing for the GPT-backed services
+
+Provides:
+- A process-wide request/token rate limiter for the OpenAI account
+- OpenAIServiceBase: retrying chat completion calls and an LRU result cache,
+  optionally backed by a SQLite file (ResultStore)
+- squash_text: compacts free text before it goes into a prompt
+"""
+import asyncio
+import hashlib
+import random
+import sqlite3
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+import orjson
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def squash_text(text: str, limit: Optional[int] = None) -> str:
+    """Collapse whitespace runs in text, cutting it to limit characters first if given"""
+    if limit is None or len(text) <= limit:
+        return " ".join(text.split())
+    return " ".join(text[:limit].split()) + "…"
+
+
+class OpenAIRateLimiter:
+    """
+    Process-wide request and token budget for OpenAI calls.
+
+    Two token buckets refill continuously at requests_per_minute and
+    tokens_per_minute; acquire() waits, in arrival order, until both can
+    cover the request, so bursts are smoothed out instead of hitting 429s.
+    The budget is shared process-wide; the lock that orders waiters is
+    created per event loop, since asyncio locks cannot cross loops.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Args:
+            requests_per_minute: Allowed requests per minute
+            tokens_per_minute: Allowed prompt + completion tokens per minute
+
+        Raises:
+            ValueError: If either limit is not positive
+        """
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            raise ValueError(
+                f"OpenAI rate limits must be positive, got {requests_per_minute} RPM "
+                f"and {tokens_per_minute} TPM"
+            )
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until one request of roughly this many tokens fits the budget.
+
+        Args:
+            tokens: Estimated prompt tokens plus max_tokens for the request
+        """
+        # A request larger than the whole budget still has to go out eventually
+        tokens = min(tokens, self.tokens_per_minute)
+
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+
+        async with lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._updated = now
+                self._requests = min(
+                    self.requests_per_minute,
+                    self._requests + elapsed * self.requests_per_minute / 60
+                )
+                self._tokens = min(
+                    self.tokens_per_minute,
+                    self._tokens + elapsed * self.tokens_per_minute / 60
+                )
+
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+
+                wait_time = max(
+                    (1 - self._requests) * 60 / self.requests_per_minute,
+                    (tokens - self._tokens) * 60 / self.tokens_per_minute
+                )
+                logger.debug(f"OpenAI rate limit: sleeping for {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+
+# Shared by every service calling OpenAI, since they draw on one account budget
+_openai_rate_limiter: Optional[OpenAIRateLimiter] = None
+
+
+def get_openai_rate_limiter() -> OpenAIRateLimiter:
+    """Get or create the process-wide OpenAI rate limiter"""
+    global _openai_rate_limiter
+    if _openai_rate_limiter is None:
+        _openai_rate_limiter = OpenAIRateLimiter(settings.OPENAI_RPM, settings.OPENAI_TPM)
+    return _openai_rate_limiter
+
+
+class ResultStore:
+    """
+    SQLite-backed second tier for the in-memory GPT result cache.
+
+    Results survive restarts, so reprocessing a profile after a deploy does
+    not pay for GPT again. Entries older than ttl_seconds are never returned
+    and are pruned when the store is opened.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float):
+        """
+        Args:
+            path: SQLite database file (created with its directory if missing)
+            ttl_seconds: Maximum age of a returned entry
+        """
+        self.ttl_seconds = ttl_seconds
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit; every put is a single-row upsert
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS gpt_results "
+            "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "DELETE FROM gpt_results WHERE stored_at < ?", (time.time() - ttl_seconds,)
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored JSON bytes for key, or None if missing, expired or unreadable"""
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM gpt_results WHERE key = ? AND stored_at >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"GPT result store read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store JSON bytes for key, replacing any older entry"""
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO gpt_results (key, stored_at, value) VALUES (?, ?, ?)",
+                (key, time.time(), value)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"GPT result store write failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
+
+class OpenAIServiceBase:
+    """
+    Base for services that call OpenAI chat completions.
+
+    Subclasses set CACHE_VERSION and CACHE_MAX_ENTRIES, call __init__ and
+    then assign self.client (None when no API key is configured).
+    """
+
+    # Mixed into every cache key; subclasses bump theirs when prompts or the
+    # model change so stale results are not served
+    CACHE_VERSION = ""
+    CACHE_MAX_ENTRIES = 1024
+
+    # Retry policy for transient OpenAI failures (429s, 5xx, dropped connections)
+    MAX_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 1.0
+    RATE_LIMIT_BASE_DELAY = 4.0
+    RETRY_MAX_DELAY = 30.0
+
+    def __init__(self):
+        # Caps the number of in-flight OpenAI requests across all callers
+        self._semaphore = asyncio.Semaphore(settings.OPENAI_CONCURRENCY)
+
+        # Paces requests to the account's RPM/TPM limits (shared by all services)
+        self._rate_limiter = get_openai_rate_limiter()
+
+        # Results as JSON bytes, keyed by a hash of the prompt inputs (LRU order)
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+        # Persistent tier behind the LRU (None when GPT_CACHE_PATH is unset)
+        self._store: Optional[ResultStore] = None
+        if settings.GPT_CACHE_PATH:
+            try:
+                self._store = ResultStore(
+                    settings.GPT_CACHE_PATH, settings.GPT_CACHE_TTL_DAYS * 86400
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"GPT result store unavailable, caching in memory only: {e}")
+
+        self.client = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections used for OpenAI requests and the result store"""
+        if self.client:
+            await self.client.close()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    async def _call_gpt(self, **kwargs) -> Any:
+        """
+        Create a chat completion, retrying transient failures with backoff.
+
+        Rate limits back off from RATE_LIMIT_BASE_DELAY, connection errors,
+        timeouts and 5xx responses from RETRY_BASE_DELAY; both double per
+        attempt up to RETRY_MAX_DELAY, with jitter so concurrent callers do not
+        retry in lockstep. Other errors (bad requests, auth) are raised at once.
+        A concurrency slot is held only while a request is being created, not
+        during rate-limit waits or retry backoff.
+
+        Args:
+            **kwargs: Arguments for client.chat.completions.create
+
+        Returns:
+            The completion (or stream, when stream=True)
+
+        Raises:
+            Exception: The last error once MAX_ATTEMPTS is reached
+        """
+        # OpenAI counts prompt tokens plus max_tokens against TPM; ~4 chars per token
+        prompt_chars = sum(len(message["content"]) for message in kwargs["messages"])
+        estimated_tokens = prompt_chars // 4 + kwargs.get("max_tokens", 0)
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            await self._rate_limiter.acquire(estimated_tokens)
+            try:
+                async with self._semaphore:
+                    return await self.client.chat.completions.create(**kwargs)
+            except (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError) as e:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    logger.error(f"All {self.MAX_ATTEMPTS} OpenAI attempts failed: {e}")
+                    raise
+                base = self.RATE_LIMIT_BASE_DELAY if isinstance(e, RateLimitError) else self.RETRY_BASE_DELAY
+                wait_time = min(self.RETRY_MAX_DELAY, base * 2 ** attempt)
+                wait_time = random.uniform(wait_time / 2, wait_time)
+                logger.warning(
+                    f"OpenAI attempt {attempt + 1}/{self.MAX_ATTEMPTS} failed: {e}. "
+                    f"Retrying in {wait_time:.1f}s..."
+                )
+                await asyncio.sleep(wait_time)
+
+    def _cache_key(self, subject: str, context: str) -> str:
+        """Hash the inputs that determine a GPT response into a cache key"""
+        payload = f"{self.CACHE_VERSION}\0{subject}\0{context}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a fresh copy of a cached result, or None on a miss in both tiers"""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return orjson.loads(cached)
+        if self._store is None:
+            return None
+        cached = self._store.get(key)
+        if cached is None:
+            return None
+        self._remember(key, cached)
+        return orjson.loads(cached)
+
+    def _cache_put(self, key: str, value: Any) -> None:
+        """Store a result in memory and, if configured, in the persistent store"""
+        data = orjson.dumps(value)
+        self._remember(key, data)
+        if self._store is not None:
+            self._store.put(key, data)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Add JSON bytes to the in-memory LRU, evicting the oldest entry when full"""
+        self._cache[key] = data
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
@@ -30,7 +30,7 @@ class SkillProfileService:
         self.validation_service = get_validation_service()
         self.normalizer = get_normalization_service()
 
-    def build_skill_profile(
+    async def build_skill_profile(
         self,
         submission_id: UUID,
         db: Session
@@ -48,7 +48,7 @@ class SkillProfileService:
         logger.info(f"Building skill profile for submission {submission_id}")
 
         # Get validated skills
-        validation_results = self.validation_service.validate_submission_skills(
+        validation_results = await self.validation_service.validate_submission_skills(
             submission_id, db
         )
 
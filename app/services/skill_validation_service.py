@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 from uuid import UUID
+import asyncio
 import logging
 
 from app.services.skill_normalization import get_normalization_service
@@ -43,7 +44,7 @@ class SkillValidationService:
         self.use_gpt_scoring = use_gpt_scoring
         logger.info(f"Skill validation service initialized with {'GPT' if use_gpt_scoring else 'legacy'} scoring")
 
-    def validate_submission_skills(
+    async def validate_submission_skills(
         self,
         submission_id: UUID,
         db: Session
@@ -60,25 +61,16 @@ class SkillValidationService:
         """
         logger.info(f"Starting skill validation for submission {submission_id}")
 
-        # 1. Collect skills from all sources
-        source_skills = self._collect_skills_from_sources(submission_id, db)
-
-        # 2. Normalize all skills
-        normalized_skills = self._normalize_all_skills(source_skills)
-
-        # 3. Build skill-source mapping
-        skill_sources = self._build_skill_source_mapping(normalized_skills, source_skills)
-
-        # 4. Gather evidence and enhanced data for scoring
-        evidence_map = self._gather_skill_evidence(submission_id, db, skill_sources)
-        enhanced_data = self._gather_enhanced_data(submission_id, db)
+        # 1-4. Load skills, evidence and enhanced data (blocking queries, kept off the event loop)
+        source_skills, skill_sources, evidence_map, enhanced_data = await asyncio.to_thread(
+            self._load_validation_inputs, submission_id, db
+        )
 
         # 5. Calculate confidence scores (GPT or legacy)
         if self.use_gpt_scoring:
-            import asyncio
-            confidence_results = asyncio.run(self._calculate_gpt_confidence_scores(
+            confidence_results = await self._calculate_gpt_confidence_scores(
                 skill_sources, enhanced_data
-            ))
+            )
         else:
             confidence_results = self._calculate_legacy_confidence_scores(
                 skill_sources, evidence_map
@@ -133,6 +125,29 @@ class SkillValidationService:
 
         return results
 
+    def _load_validation_inputs(
+        self,
+        submission_id: UUID,
+        db: Session
+    ) -> Tuple[
+        Dict[str, Dict[str, Any]], Dict[str, Dict[str, bool]], Dict[str, Dict[str, Any]], Dict[str, Any]
+    ]:
+        """Run the database-bound steps of validation: collect, normalize, map and gather evidence"""
+        # 1. Collect skills from all sources
+        source_skills = self._collect_skills_from_sources(submission_id, db)
+
+        # 2. Normalize all skills
+        normalized_skills = self._normalize_all_skills(source_skills)
+
+        # 3. Build skill-source mapping
+        skill_sources = self._build_skill_source_mapping(normalized_skills, source_skills)
+
+        # 4. Gather evidence and enhanced data for scoring
+        evidence_map = self._gather_skill_evidence(submission_id, db, skill_sources)
+        enhanced_data = self._gather_enhanced_data(submission_id, db)
+
+        return source_skills, skill_sources, evidence_map, enhanced_data
+
     def _collect_skills_from_sources(
         self,
         submission_id: UUID,
@@ -400,13 +415,16 @@ class SkillValidationService:
         """Calculate confidence scores using legacy mathematical scoring"""
         logger.info("Using legacy mathematical scoring")
         results = []
+        now = datetime.now()
 
         for skill, sources in skill_sources.items():
             evidence = evidence_map.get(skill, {})
             confidence = self.confidence_calc.calculate_skill_confidence(
                 skill=skill,
                 sources=sources,
-                evidence=evidence
+                evidence=evidence,
+                include_sources_list=False,
+                now=now
             )
             results.append(confidence)
 
@@ -0,0 +1,58 @@
+"""
+Test suite for the CV Data Extractor
+"""
+from app.services.extractor import DataExtractor
+
+
+class TestContactExtraction:
+    """Test email and phone extraction"""
+
+    def test_phone_with_non_breaking_spaces(self):
+        """Test phone groups separated by NBSP (common in PDF text) are kept together"""
+        assert DataExtractor.extract_phone("+1\xa0555\xa0123\xa04567") == ("+15551234567", 95.0)
+        assert DataExtractor.extract_phone("Tel: +44\xa020\xa07946\xa00958")[0] == "+442079460958"
+
+    def test_phone_with_regular_spaces(self):
+        """Test a plain international number"""
+        assert DataExtractor.extract_phone("Phone: +1 555 123 4567") == ("+15551234567", 95.0)
+
+    def test_email_next_to_non_breaking_space(self):
+        """Test an email surrounded by NBSP is found and lowercased"""
+        email, confidence = DataExtractor.extract_email("Email:\xa0Jane.Doe@Gmail.com\xa0|")
+        assert email == "jane.doe@gmail.com"
+        assert confidence == 95.0
+
+
+class TestSocialLinkExtraction:
+    """Test GitHub, LinkedIn, Twitter and portfolio link extraction"""
+
+    def test_github_after_portfolio_link(self):
+        """Test a portfolio URL directly before a GitHub URL does not hide it"""
+        links = DataExtractor.extract_social_links(
+            "Links: https://jane.dev/work|https://github.com/jane"
+        )
+        assert links['github'] == ("https://github.com/jane", 90.0)
+        assert links['portfolio'] == ("https://jane.dev", 70.0)
+
+    def test_github_subdomain(self):
+        """Test a github.com subdomain link still yields the username"""
+        links = DataExtractor.extract_social_links("Code: https://gist.github.com/jane")
+        assert links['github'] == ("https://github.com/jane", 90.0)
+
+    def test_linkedin_and_twitter(self):
+        """Test LinkedIn and Twitter/X profiles in one line"""
+        links = DataExtractor.extract_social_links(
+            "linkedin.com/in/jane-doe · x.com/jane_doe"
+        )
+        assert links['linkedin'] == ("https://linkedin.com/in/jane-doe", 90.0)
+        assert links['twitter'] == ("https://twitter.com/jane_doe", 85.0)
+
+    def test_domain_ending_in_x_is_not_twitter(self):
+        """Test a domain such as dropbox.com is not read as an x.com link"""
+        links = DataExtractor.extract_social_links("Files: dropbox.com/jane")
+        assert links['twitter'] == (None, 0.0)
+
+    def test_no_links(self):
+        """Test text without URLs yields no links"""
+        links = DataExtractor.extract_social_links("No links here")
+        assert all(value == (None, 0.0) for value in links.values())
@@ -232,7 +232,7 @@ async def test_with_real_submission(submission_id: str):
         print("Running Skill Validation with GPT Scoring...")
         validation_service = SkillValidationService(use_gpt_scoring=True)
         from uuid import UUID
-        result = validation_service.validate_submission_skills(
+        result = await validation_service.validate_submission_skills(
             submission_id=UUID(submission_id),
             db=db
         )
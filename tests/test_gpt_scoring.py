@@ -3,7 +3,10 @@ Test suite for GPT Scoring Service
 """
 import pytest
 import asyncio
+import json
+from types import SimpleNamespace
 from app.services.gpt_scoring_service import GPTScoringService, get_gpt_scoring_service
+from app.services.openai_common import OpenAIRateLimiter, get_openai_rate_limiter
 
 
 def test_service_initialization():
@@ -153,8 +156,385 @@ async def test_context_preparation():
         cv_data=None
     )
 
-    assert "Python" in context
-    assert "testuser" in context or "GITHUB" in context
+    assert "GITHUB EVIDENCE" in context
+    assert "Used in 5 repositories" in context
+    # The skill name is sent after the evidence, not inside it
+    assert "Python" not in context
+
+
+def test_comprehensive_context_fits_budget():
+    """Test low-value free text is dropped first to keep the context within budget"""
+    service = GPTScoringService()
+    service.CONTEXT_MAX_CHARS = 900
+
+    github_data = {
+        "username": "testuser",
+        "readme_samples": [{"repo_name": "api", "content": "readme " * 60}],
+        "commit_samples": [{"message": "commit " * 20} for _ in range(5)],
+    }
+    web_mentions = [
+        {"title": f"Talk {i}", "source_name": "blog", "snippet": "snippet " * 30}
+        for i in range(3)
+    ]
+
+    context = service._prepare_comprehensive_context(
+        github_data, None, web_mentions, {"skills": ["Python"]}
+    )
+
+    assert len(context) <= 900
+    assert "snippet" not in context
+    assert "readme" in context
+    assert "[Web] 3 mentions" in context
+    assert context.endswith("skills: Python")
+
+
+def test_shared_evidence_index_matches_per_skill_context():
+    """Test a prebuilt evidence index yields the same context as building it per skill"""
+    service = GPTScoringService()
+
+    github_data = {
+        "username": "testuser",
+        "languages": {"Python": 5, "Go": 2},
+        "readme_samples": [{"repo_name": "api", "content": "FastAPI service in PYTHON with Docker"}],
+        "commit_samples": [{"message": "Add docker-compose"}, {"message": "Bump python to 3.11"}]
+    }
+    linkedin_data = {"headline": "Python Developer", "skills": ["Docker"], "experience": []}
+    web_mentions = [{"title": "Scaling Go services", "content": "", "snippet": "..."}]
+
+    index = service._build_evidence_index(github_data, linkedin_data, web_mentions, None)
+
+    for skill in ["Python", "Docker", "Go", "Rust"]:
+        assert service._prepare_skill_context(
+            skill, github_data, linkedin_data, web_mentions, None, index
+        ) == service._prepare_skill_context(
+            skill, github_data, linkedin_data, web_mentions, None
+        )
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that records call counts"""
+
+    def __init__(self, payload, delay=0.0):
+        self.payload = payload
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.last_kwargs = kwargs
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        content = json.dumps(self.payload)
+        if kwargs.get("stream"):
+            return self._stream(content)
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    async def _stream(self, content, size=7):
+        for i in range(0, len(content), size):
+            delta = SimpleNamespace(content=content[i:i + size])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)])
+        delta = SimpleNamespace(content=None)
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason="stop")])
+
+
+def make_fake_client(payload, delay=0.0):
+    """Build a service wired to a FakeCompletions instance"""
+    completions = FakeCompletions(payload, delay)
+    service = GPTScoringService()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return service, completions
+
+
+@pytest.mark.asyncio
+async def test_score_skills_parallel_caps_concurrency():
+    """Test per-skill fan-out keeps order and respects the semaphore"""
+    service, completions = make_fake_client(
+        {"confidence_score": 70, "proficiency_level": "intermediate"}, delay=0.01
+    )
+    service._semaphore = asyncio.Semaphore(3)
+
+    skills = [f"Skill{i}" for i in range(10)]
+    results = await service.score_skills_parallel(skills, cv_data={"skills": skills})
+
+    assert [r["skill"] for r in results] == skills
+    assert all(r["confidence_score"] == 70 for r in results)
+    assert completions.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_repeated_scoring_uses_cache():
+    """Test identical inputs are scored by GPT only once"""
+    service, completions = make_fake_client(
+        {"confidence_score": 80, "key_evidence": ["ml-pipeline"]}
+    )
+    github_data = {"username": "testuser", "languages": {"Python": 5}}
+
+    first = await service.score_skill_confidence("Python", github_data=github_data)
+    first["key_evidence"].append("mutated by caller")
+    second = await service.score_skill_confidence("Python", github_data=github_data)
+
+    assert completions.calls == 1
+    assert second["confidence_score"] == 80
+    assert second["key_evidence"] == ["ml-pipeline"]
+    assert "scored_at" in second
+
+    await service.score_skill_confidence(
+        "Python", github_data={"username": "other", "languages": {"Python": 1}}
+    )
+    assert completions.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_survives_a_new_service(monkeypatch, tmp_path):
+    """Test scores stored on disk are reused by a fresh service instance"""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "GPT_CACHE_PATH", str(tmp_path / "gpt.sqlite3"))
+    github_data = {"username": "testuser", "languages": {"Python": 5}}
+
+    service, completions = make_fake_client({"confidence_score": 80})
+    await service.score_skill_confidence("Python", github_data=github_data)
+    service._store.close()
+
+    restarted, restarted_completions = make_fake_client({"confidence_score": 10})
+    result = await restarted.score_skill_confidence("Python", github_data=github_data)
+    restarted._store.close()
+
+    assert completions.calls == 1
+    assert restarted_completions.calls == 0
+    assert result["confidence_score"] == 80
+
+
+def test_parse_streamed_skills_on_partial_buffers():
+    """Test skill objects are decoded exactly once as they close"""
+    payload = json.dumps({
+        "skills": [
+            {"skill": "Python", "confidence_score": 90, "key_evidence": ["a}b"]},
+            {"skill": "Docker", "confidence_score": 60}
+        ],
+        "overall_assessment": "ok"
+    })
+
+    decoded = []
+    pos = 0
+    for end in range(len(payload) + 1):
+        completed, pos = GPTScoringService._parse_streamed_skills(payload[:end], pos)
+        decoded.extend(completed)
+
+    assert [d["skill"] for d in decoded] == ["Python", "Docker"]
+    assert decoded[0]["key_evidence"] == ["a}b"]
+
+
+@pytest.mark.asyncio
+async def test_stream_multiple_skills_yields_each_skill():
+    """Test streamed batch scoring yields every skill and matches the list API"""
+    payload = {
+        "skills": [
+            {"skill": "Python", "confidence_score": 90},
+            {"skill": "Docker", "confidence_score": 60}
+        ]
+    }
+    service, completions = make_fake_client(payload)
+    cv_data = {"skills": ["Python", "Docker"]}
+
+    streamed = [
+        s async for s in service.stream_multiple_skills(["Python", "Docker"], cv_data=cv_data)
+    ]
+    assert [s["skill"] for s in streamed] == ["Python", "Docker"]
+    assert completions.last_kwargs["max_tokens"] == (
+        service.BATCH_BASE_TOKENS + 2 * service.BATCH_TOKENS_PER_SKILL
+    )
+    assert all("scored_at" in s for s in streamed)
+
+    # Served from cache the second time
+    listed = await service.score_multiple_skills(["Docker", "Python"], cv_data=cv_data)
+    assert [s["confidence_score"] for s in listed] == [90, 60]
+    assert completions.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_multiple_skills_releases_semaphore_before_yielding():
+    """Test a paused consumer does not hold a concurrency slot"""
+    payload = {"skills": [{"skill": "Python", "confidence_score": 90}]}
+    service, completions = make_fake_client(payload)
+    service._semaphore = asyncio.Semaphore(1)
+
+    stream = service.stream_multiple_skills(["Python"], cv_data={"skills": ["Python"]})
+    first = await stream.__anext__()
+    assert first["skill"] == "Python"
+
+    # The consumer is suspended mid-iteration; other requests can still run
+    other = await asyncio.wait_for(
+        service.score_skill_confidence("Go", cv_data={"skills": ["Go"]}), timeout=1
+    )
+    assert other["skill"] == "Go"
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_scorings_share_one_call():
+    """Test duplicate in-flight scorings wait for the first GPT call"""
+    service, completions = make_fake_client({"confidence_score": 75}, delay=0.02)
+
+    results = await asyncio.gather(*(
+        service.score_skill_confidence("Python", cv_data={"skills": ["Python"]})
+        for _ in range(5)
+    ))
+
+    assert completions.calls == 1
+    assert all(r["confidence_score"] == 75 for r in results)
+    assert len({id(r) for r in results}) == 5
+    assert not service._inflight
+
+
+@pytest.mark.asyncio
+async def test_transient_openai_errors_are_retried():
+    """Test rate-limited calls are retried instead of falling back"""
+    from openai import RateLimitError
+
+    class FakeRateLimit(RateLimitError):
+        def __init__(self):
+            Exception.__init__(self, "429 Too Many Requests")
+
+    service, completions = make_fake_client({"confidence_score": 85})
+    service.RATE_LIMIT_BASE_DELAY = 0
+    create = completions.create
+    failures = [FakeRateLimit(), FakeRateLimit()]
+
+    async def flaky_create(**kwargs):
+        if failures:
+            raise failures.pop()
+        return await create(**kwargs)
+
+    completions.create = flaky_create
+
+    result = await service.score_skill_confidence("Python", cv_data={"skills": ["Python"]})
+
+    assert result["confidence_score"] == 85
+    assert completions.calls == 1
+    assert not failures
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_does_not_hold_a_concurrency_slot():
+    """Test other requests can run while a failed call waits to retry"""
+    from openai import RateLimitError
+
+    class FakeRateLimit(RateLimitError):
+        def __init__(self):
+            Exception.__init__(self, "429 Too Many Requests")
+
+    service, completions = make_fake_client({"confidence_score": 85})
+    service._semaphore = asyncio.Semaphore(1)
+    service.RATE_LIMIT_BASE_DELAY = 0.1
+    create = completions.create
+    failures = [FakeRateLimit()]
+    order = []
+
+    async def flaky_create(**kwargs):
+        skill = kwargs["messages"][-1]["content"].rsplit(": ", 1)[1]
+        if skill == "Python" and failures:
+            order.append("Python failed")
+            raise failures.pop()
+        order.append(skill)
+        return await create(**kwargs)
+
+    completions.create = flaky_create
+
+    async def score_go_later():
+        # Let the Python request fail and start backing off first
+        await asyncio.sleep(0)
+        return await service.score_skill_confidence("Go", cv_data={"skills": ["Go"]})
+
+    await asyncio.gather(
+        service.score_skill_confidence("Python", cv_data={"skills": ["Python"]}),
+        score_go_later()
+    )
+
+    assert order == ["Python failed", "Go", "Python"]
+
+
+def test_rate_limiter_rejects_non_positive_limits():
+    """Test a zero or negative RPM/TPM setting fails fast instead of dividing by zero"""
+    with pytest.raises(ValueError):
+        OpenAIRateLimiter(requests_per_minute=0, tokens_per_minute=60000)
+    with pytest.raises(ValueError):
+        OpenAIRateLimiter(requests_per_minute=600, tokens_per_minute=-1)
+
+
+@pytest.mark.asyncio
+async def test_skills_without_evidence_skip_gpt():
+    """Test skills with no evidence anywhere are scored without a GPT call"""
+    payload = {"skills": [{"skill": "Python", "confidence_score": 90}]}
+    service, completions = make_fake_client(payload)
+
+    result = await service.score_skill_confidence("Rust", cv_data={"skills": ["Python"]})
+    assert result["confidence_score"] == 15
+    assert result["evidence_quality"] == "low"
+    assert completions.calls == 0
+
+    streamed = [
+        s async for s in service.stream_multiple_skills(
+            ["Rust", "Python"], cv_data={"skills": ["Python"]}
+        )
+    ]
+    assert [s["skill"] for s in streamed] == ["Rust", "Python"]
+    assert streamed[1]["confidence_score"] == 90
+    assert completions.calls == 1
+    assert "Rust" not in completions.last_kwargs["messages"][-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_token_budget(monkeypatch):
+    """Test the limiter delays a request once the token budget is spent"""
+    from app.services import openai_common
+
+    # A fake clock that only moves when the limiter sleeps
+    now = [1000.0]
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr(openai_common, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(openai_common.asyncio, "sleep", fake_sleep)
+
+    # 1000 tokens refill per second
+    limiter = OpenAIRateLimiter(requests_per_minute=6000, tokens_per_minute=60000)
+
+    await limiter.acquire(60000)
+    assert sleeps == []
+
+    await limiter.acquire(100)
+    assert sum(sleeps) == pytest.approx(0.1)
+
+
+def test_rate_limiter_works_across_event_loops():
+    """Test the shared limiter can queue waiters on more than one event loop"""
+    limiter = OpenAIRateLimiter(requests_per_minute=60000, tokens_per_minute=600000)
+
+    async def drain_then_wait():
+        await asyncio.gather(limiter.acquire(600000), *(limiter.acquire(500) for _ in range(3)))
+
+    async def wait():
+        await asyncio.gather(*(limiter.acquire(500) for _ in range(3)))
+
+    asyncio.run(drain_then_wait())
+    asyncio.run(wait())
+
+
+def test_services_share_openai_rate_limiter():
+    """Test every service draws on the same process-wide OpenAI budget"""
+    assert GPTScoringService()._rate_limiter is get_openai_rate_limiter()
+    assert GPTScoringService()._rate_limiter is get_openai_rate_limiter()
 
 
 if __name__ == "__main__":
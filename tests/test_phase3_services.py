@@ -202,6 +202,32 @@ class TestConfidenceCalculator:
         result = self.service.calculate_skill_confidence("Python", sources)
         assert result["base_score"] == 50
 
+    def test_base_score_every_source_combination(self):
+        """Test base score for each branch of the source priority rules"""
+        cases = [
+            # (cv, github, web, stackoverflow) -> base score
+            ((True, True, True, True), 95),
+            ((True, True, True, False), 90),
+            ((True, True, False, True), 75),
+            ((True, True, False, False), 75),
+            ((True, False, True, True), 60),
+            ((True, False, False, False), 60),
+            ((False, True, True, True), 50),  # GitHub takes precedence
+            ((False, True, False, False), 50),
+            ((False, False, True, True), 40),  # Web before Stack Overflow
+            ((False, False, True, False), 40),
+            ((False, False, False, True), 45),
+            ((False, False, False, False), 0),
+        ]
+        for (cv, github, web, stackoverflow), expected in cases:
+            sources = {"cv": cv, "github": github, "web_mentions": web, "stackoverflow": stackoverflow}
+            assert self.service._calculate_base_score(sources) == expected, f"Failed for: {sources}"
+
+    def test_blog_counts_as_web_source(self):
+        """Test that a blog mention satisfies the web tier"""
+        sources = {"cv": True, "github": True, "web_mentions": False, "stackoverflow": False, "blog": True}
+        assert self.service._calculate_base_score(sources) == 90
+
     def test_merge_skill_sources(self):
         """Test merging skills from multiple sources"""
         cv_skills = ["Python", "JavaScript"]
@@ -285,6 +311,23 @@ class TestHallucinationDetector:
         result = self.service.analyze_skill("Python", sources, evidence)
         assert any(f["factor"] == "stale_skill" for f in result["risk_factors"])
 
+    def test_days_since_activity_uses_shared_now(self):
+        """Test activity age is measured against the supplied clock reading"""
+        now_ts = datetime.fromisoformat("2020-01-11T12:00:00+00:00").timestamp()
+        assert self.service._get_days_since_activity("2020-01-01T00:00:00Z", now_ts) == 10
+        assert self.service._get_days_since_activity("not a date", now_ts) == 999
+        assert self.service._get_days_since_activity(None, now_ts) == 999
+
+    def test_profile_inconsistency_checks_each_keyword_category(self):
+        """Test every keyword category in a skill needs its supporting languages"""
+        context = self.service._profile_main_skills({"main_skills": ["Python", "JavaScript"]})
+        assert not self.service._check_profile_inconsistency("tensorflow", context)
+        assert self.service._check_profile_inconsistency("ios development", context)
+        # ML is covered by Python, but the mobile keyword still needs Swift/Kotlin
+        assert self.service._check_profile_inconsistency("pytorch mobile", context)
+        assert not self.service._check_profile_inconsistency("ethereum", context)
+        assert not self.service._check_profile_inconsistency("django", frozenset())
+
     def test_high_risk_score_is_hallucination(self):
         """Test high risk score is flagged as hallucination"""
         # Multiple risk factors: single source, no CV, no GitHub, vague skill